@@ -242,35 +242,86 @@ empties, the existing card will be detected.
 
 ################################################################################
 
+import time
+# When each phase of the startup ended, cf. --profile-startup
+STARTUP = [ ('start', time.perf_counter()) ]
+
 import argparse
+import atexit
+import bisect
+import collections
 import copy
 import datetime
 import difflib
 import enum
 import functools
 import html
+import http.client
+import importlib
+import itertools
 import json
 import logging
 import math
 import os
 import pprint
+import queue
 import random
 import readline
+import select
+import shutil
 import socket
+import sqlite3
 import subprocess
 import sys
 import tempfile
+import termios
 import textwrap
-import time
+import threading
+import tty
+import types
+import zlib
 from typing import Optional
 from urllib import request, parse
-from urllib.error import HTTPError, URLError
+from urllib.error import HTTPError
+
+STARTUP += [ ('stdlib imports', time.perf_counter()) ]
+
+
+# Modules imported lazily, by name, cf. lazy_import()
+LAZY = {}
+
+
+class LazyModule(types.ModuleType):
+    """Stands in for a module, until it's used (any of its attributes)
+
+    Then it's imported, and its attributes are copied here. (Rather than
+    importlib.util.LazyLoader, which isn't thread-safe before Python 3.12,
+    while eg the Lookahead renders cards in a background thread.)
+    """
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+
+def lazy_import(name):
+    """Import a module, but only load it on first use
+
+    Since most sessions are quick lookups, that don't need most of them.
+    """
+    LAZY[name] = LazyModule(name)
+    return LAZY[name]
+
+
+def lazy_loaded(name):
+    """Whether a lazy_import() module was already used (and hence loaded)"""
+    return name in sys.modules
 
 
 # External dependencies
 import addict
-import autopage
-import bs4  # BeautifulSoup
+autopage = lazy_import('autopage')
 
 # NB, the pip package is called iso-639 (with "-").
 # And this is TODO DEPRECATED
@@ -280,10 +331,10 @@ import bs4  # BeautifulSoup
 # replacement is to enable the '--use-pep517' option. Discussion can be found at
 # https://github.com/pypa/pip/issues/8559
 # Alternatively, try: https://pypi.org/project/pycountry/
-import iso639  # Map e.g. 'de' to 'german', as required by SnowballStemmer
+iso639 = lazy_import('iso639')  # Map e.g. 'de' to 'german', as required by SnowballStemmer
 
-import pyperclip
-import readchar  # For reading single key-press commands
+pyperclip = lazy_import('pyperclip')
+readchar = lazy_import('readchar')  # For reading single key-press commands
 
 # The override for `re` is necessary for wildcard searches, due to extra
 # interpolation. # Otherwise 're' raises an exception. Search for 'regex' below.
@@ -293,8 +344,12 @@ import readchar  # For reading single key-press commands
 # errors."
 import regex as re
 
-import unidecode
-from nltk.stem.snowball import SnowballStemmer
+unidecode = lazy_import('unidecode')
+# NB, nltk (for its SnowballStemmer) takes longer to import than everything
+# else together, so it's only imported once needed, cf. get_stemmer().
+# (LazyLoader wouldn't help, since finding nltk.stem.snowball imports nltk.)
+
+STARTUP += [ ('external imports', time.perf_counter()) ]
 
 p = print
 pp = pprint.PrettyPrinter(indent=4)
@@ -353,6 +408,8 @@ def W(color:str, string:str=''):
 class Key(enum.StrEnum):
     # The Esc key is doubled, since it's is a modifier and isn't accepted solo
     ESC_ESC = '\x1b\x1b'
+    # A lone Esc, as returned by readkey() with a timeout
+    ESC     = '\x1b'
     CTRL_C  = '\x03'
     CTRL_D  = '\x04'
     CTRL_P  = '\x10'
@@ -361,14 +418,239 @@ class Key(enum.StrEnum):
     DEL     = '\x1b[3~'
 
 
+################################################################################
+# Metrics
+
+class Metric:
+    """Count, total time and size of one kind of request, eg one anki action"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.bytes = 0
+        # Seconds, of the most recent requests, for the percentiles
+        self.latencies = collections.deque(maxlen=1000)
+
+    def quantile(self, q):
+        latencies = sorted(self.latencies)
+        return latencies and latencies[min(len(latencies) - 1, int(len(latencies) * q))]
+
+
+class Metrics:
+    """Latency and payload size per anki-connect action and per remote fetch
+
+    Metrics are by (kind, name), eg ('invoke', 'findCards') or ('fetch',
+    'woorden'). They're only collected when enabled (cf. --metrics): callers
+    check `metrics.enabled` before even timing a request, so otherwise the
+    overhead is an attribute lookup. The caches count their hits and misses
+    anyway (cf. Cache.stats()), and are included in the report() and export().
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # (kind, name) => Metric
+        self.metrics = {}
+        self.lock = threading.Lock()
+
+    def record(self, kind, name, seconds, nbytes=0):
+        with self.lock:
+            metric = self.metrics.get((kind, name))
+            if not metric:
+                metric = self.metrics[kind, name] = Metric()
+            metric.count += 1
+            metric.total += seconds
+            metric.bytes += nbytes
+            metric.latencies.append(seconds)
+
+    def summary(self):
+        with self.lock:
+            metrics = sorted(self.metrics.items())
+        return [
+            {
+                'kind'  : kind,
+                'name'  : name,
+                'count' : metric.count,
+                'total' : metric.total,
+                'p50'   : metric.quantile(.50),
+                'p95'   : metric.quantile(.95),
+                'bytes' : metric.bytes,
+            } for (kind, name), metric in metrics
+        ]
+
+    def caches(self):
+        caches = { name: cache.stats() for name, cache in sorted(CACHES.items()) }
+        if page_cache:
+            caches['pages'] = {
+                'hits': page_cache.hits, 'misses': page_cache.misses, 'evicted': page_cache.evicted,
+            }
+        return caches
+
+    def report(self):
+        """One line per metric, eg for the 'i' command"""
+        if not self.enabled:
+            return W(C.INFO, 'Request metrics are disabled, cf. --metrics')
+        lines = []
+        for m in self.summary():
+            lines += [ ''
+                + f"{m['kind']:7s} {m['name']:40s} "
+                + f"count:{m['count']:6d} "
+                + f"total:{m['total'] * 1000:8.0f}ms "
+                + f"p50:{m['p50'] * 1000:7.1f}ms "
+                + f"p95:{m['p95'] * 1000:7.1f}ms "
+                + f"bytes:{m['bytes']:10d}"
+            ]
+        return '\n'.join(lines)
+
+    def export(self, format='json'):
+        """As 'json', or else in the Prometheus text format"""
+
+        if format == 'json':
+            return json.dumps(
+                { 'requests': self.summary(), 'caches': self.caches() }, indent=4
+            )
+
+        lines = []
+        def add(metric, type, samples):
+            lines.append(f'# TYPE anki_cli_{metric} {type}')
+            for suffix, labels, value in samples:
+                labels = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f'anki_cli_{metric}{suffix}{{{labels}}} {value}')
+
+        requests = self.summary()
+        samples = []
+        for m in requests:
+            labels = { 'kind': m['kind'], 'name': m['name'] }
+            samples += [
+                ('', { **labels, 'quantile': '0.5'  }, m['p50']),
+                ('', { **labels, 'quantile': '0.95' }, m['p95']),
+                ('_sum',   labels, m['total']),
+                ('_count', labels, m['count']),
+            ]
+        add('request_seconds', 'summary', samples)
+        add('request_bytes_total', 'counter', [
+            ('', { 'kind': m['kind'], 'name': m['name'] }, m['bytes']) for m in requests
+        ])
+        caches = self.caches()
+        for stat in ('hits', 'misses', 'evicted'):
+            add(f'cache_{stat}_total', 'counter', [
+                ('', { 'cache': name }, stats[stat]) for name, stats in caches.items()
+            ])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """Export to a file: JSON if it's *.json, else Prometheus text"""
+        format = 'json' if path.endswith('.json') else 'prometheus'
+        with open(path, 'w') as file:
+            file.write(self.export(format))
+
+
+metrics = Metrics()
+
+
+################################################################################
+
+# Where the anki-connect add-on listens
+ANKI_HOST = 'localhost'
+ANKI_PORT = 8765
+
+
+class ConnectionPool:
+    """Keep-alive (HTTP/1.1) connections to anki-connect, reused across requests
+
+    Opening a new TCP connection for every action is most of the latency of a
+    request to a local server. So, each request borrows an idle connection from
+    the pool (or opens a new one) and gives it back afterwards.
+
+    If a reused connection turns out to be stale (eg Anki was restarted, or the
+    server closed it while idle) while sending, it's discarded and the request
+    is retried on a fresh connection. Any other connection error is raised to
+    the caller. cf. invoke(), which then falls back to assert_anki()
+
+    Once the request was sent, it's never sent again here, since it might have
+    been processed already, cf. RequestUnconfirmed
+    """
+
+    def __init__(self, host=ANKI_HOST, port=ANKI_PORT, *, size=4, timeout=None):
+        self.host = host
+        self.port = port
+        # No timeout by default, since eg a 'sync' can take a while
+        self.timeout = timeout
+        self.idle = queue.LifoQueue(maxsize=size)
+
+    def acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+
+    def release(self, conn: http.client.HTTPConnection):
+        try:
+            self.idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def clear(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def request(self, body: bytes) -> bytes:
+        """POST the (JSON) body and return the (JSON) body of the response"""
+
+        while True:
+            conn = self.acquire()
+            # Only a connection that was already open can be stale
+            reused = conn.sock is not None
+            try:
+                conn.request(
+                    'POST', '/', body, {'Content-Type': 'application/json'}
+                )
+            except (http.client.HTTPException, OSError):
+                # (At most) part of the request was sent, so it wasn't processed
+                conn.close()
+                if reused:
+                    logging.debug('Stale connection, reconnecting')
+                    continue
+                raise
+            try:
+                response = conn.getresponse()
+                content = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                # Eg RemoteDisconnected, or a timeout
+                conn.close()
+                raise RequestUnconfirmed(e) from e
+            # If the server didn't agree to keep-alive, http.client has already
+            # closed the socket, and it'll just reconnect on the next request.
+            self.release(conn)
+            if response.status != 200:
+                raise RequestUnconfirmed(f'{response.status} {response.reason}')
+            return content
+
+
+class RequestUnconfirmed(http.client.HTTPException):
+    """A request was sent, but it's unknown whether anki-connect processed it
+
+    So, it's only safe to send it again if that's idempotent, cf. invoke()
+    (The Journal instead checks for itself what was done already.)
+    """
+
+
+anki_pool = ConnectionPool()
+
+
 def assert_anki(retry=True):
     """Ping anki-connect to check if it's running, else launch anki
 
     NB, Anki is a singleton, so this wouldn't launch multiples
     """
 
-    port = 8765
-    host = 'localhost'
+    port = ANKI_PORT
+    host = ANKI_HOST
     try:
         socket.create_connection((host, port), timeout=1).close()
         return True
@@ -394,6 +676,14 @@ def assert_anki(retry=True):
     return assert_anki(retry=False)
 
 
+# Actions that mustn't be sent twice, eg when no response came back.
+# (Others are either read-only, or idempotent, like updateNoteFields.)
+UNSAFE_ACTIONS = { 'addNote', 'addNotes', 'answerCards', 'guiAddCards' }
+
+# How many times invoke() retries a request that failed
+INVOKE_RETRIES = 2
+
+
 def invoke(action, **params):
     """Send a request to Anki desktop via the API for the anki-connect add-on
 
@@ -404,43 +694,325 @@ def invoke(action, **params):
     struct = { 'action': action, 'params': params, 'version': 6 }
     reqJson = json.dumps(struct).encode('utf-8')
     logging.debug(b'invoke:' + reqJson, stacklevel=2)
-    req = request.Request('http://localhost:8765', reqJson)
 
-    try:
-        response = json.load(request.urlopen(req))
-
-        if options.debug:
-            # Simplify some debug logging
-            result_log = copy.deepcopy(response['result'])
-            if isinstance(result_log, dict):
-                result_log = [ result_log ]
-            if isinstance(result_log, list):
-                if len(result_log) > 10:
-                    result_log = 'len:' + str(len(result_log))
-                else:
-                    for obj in result_log:
-                        if not isinstance(obj, dict): continue
-                        for field in ('question', 'answer', 'css'):
-                            if field in obj: obj[field] = '<...>'
-                        if 'fields' in obj and 'Back' in obj['fields']:
-                            obj['fields']['Back']['value'] = '<...>'
-
-            logging.debug('result:\n' + pp.pformat(result_log), stacklevel=2)
-
-        error = response['error']
-        if error is not None:
-            beep(3)
-            logging.error('error:\n' + str(error), stacklevel=2)
-            logging.error('result:\n' + pp.pformat(response['result']), stacklevel=2)
-            return None
-        else:
-            return response['result']
-    except (ConnectionRefusedError, URLError) as e:
-        if assert_anki():
-            # Retry the request
-            return invoke(action, **params)
-        else:
-            return None
+    actions = { a['action'] for a in params['actions'] } if action == 'multi' else { action }
+    for attempt in range(INVOKE_RETRIES + 1):
+        try:
+            start = metrics.enabled and time.perf_counter()
+            body = anki_pool.request(reqJson)
+            break
+        except RequestUnconfirmed as e:
+            logging.warning(f'{action}: {e}')
+            if actions & UNSAFE_ACTIONS:
+                # Might have been done already, so leave it up to the caller
+                return None
+        except (OSError, http.client.HTTPException) as e:
+            logging.debug(e)
+            # Idle connections to a previous Anki process are useless now
+            anki_pool.clear()
+            if not assert_anki():
+                return None
+    else:
+        logging.error(f'{action}: failed after {INVOKE_RETRIES} retries')
+        return None
+
+    if metrics.enabled:
+        name = action
+        if action == 'multi':
+            # eg 'multi:findCards+getDeckStats'
+            name += ':' + '+'.join(sorted(actions))
+        metrics.record('invoke', name, time.perf_counter() - start, len(reqJson) + len(body))
+    response = json.loads(body)
+
+    if options.debug:
+        # Simplify some debug logging
+        result_log = copy.deepcopy(response['result'])
+        if isinstance(result_log, dict):
+            result_log = [ result_log ]
+        if isinstance(result_log, list):
+            if len(result_log) > 10:
+                result_log = 'len:' + str(len(result_log))
+            else:
+                for obj in result_log:
+                    if not isinstance(obj, dict): continue
+                    for field in ('question', 'answer', 'css'):
+                        if field in obj: obj[field] = '<...>'
+                    if 'fields' in obj and 'Back' in obj['fields']:
+                        obj['fields']['Back']['value'] = '<...>'
+
+        logging.debug('result:\n' + pp.pformat(result_log), stacklevel=2)
+
+    error = response['error']
+    if error is not None:
+        beep(3)
+        logging.error('error:\n' + str(error), stacklevel=2)
+        logging.error('result:\n' + pp.pformat(response['result']), stacklevel=2)
+        return None
+    else:
+        return response['result']
+
+
+class Batch:
+    """Queue several anki-connect actions, to send them in one `multi` request
+
+    eg
+        batch = Batch()
+        new_i = batch.add('findCards', query='deck:nl is:new')
+        stats_i = batch.add('getDeckStats', decks=['nl'])
+        batch.send()
+        batch.results[new_i], batch.errors[new_i]
+
+    Each action has its own result and error. A failed action doesn't fail the
+    others. Its result is then None, just like for a failed invoke().
+    """
+
+    def __init__(self):
+        self.actions = []
+        self.results = []
+        self.errors = []
+
+    def __len__(self):
+        return len(self.actions)
+
+    def add(self, action, **params) -> int:
+        """Queue an action, returning its index into results/errors"""
+        self.actions.append({'action': action, 'params': params, 'version': 6})
+        return len(self.actions) - 1
+
+    def send(self) -> list:
+        """One round-trip for all the queued actions. Returns their results"""
+
+        if not self.actions:
+            return self.results
+        responses = invoke('multi', actions=self.actions)
+        if responses is None:
+            # The 'multi' itself failed (already logged by invoke)
+            responses = [{'result': None, 'error': 'multi failed'}] * len(self)
+
+        self.results = []
+        self.errors = []
+        for action, response in zip(self.actions, responses):
+            error = response.get('error')
+            if error is not None:
+                beep(3)
+                logging.error(
+                    f"error: {action['action']}:\n" + str(error), stacklevel=2
+                )
+            self.results.append(response.get('result'))
+            self.errors.append(error)
+        return self.results
+
+
+################################################################################
+# Caching
+
+# All of the caches, by name, eg for their stats, cf. cache_report()
+CACHES = {}
+
+
+class Cache:
+    """A named cache, with a TTL per entry, a size bound, and dependency tags
+
+    Tags name what an entry depends on, eg 'deck:nl', 'card:123', 'note:456'.
+    When something changes, invalidate() drops just the entries tagged with it,
+    across all caches. cf. cached(), deck_tags()
+
+    Hits and misses are counted, to see which lookups still need a request.
+    """
+
+    def __init__(self, name, *, ttl=None, maxsize=128):
+        self.name = name
+        # Seconds until an entry expires (None: only when invalidated)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key => (value, expiry, tags)
+        self.entries = collections.OrderedDict()
+        self.lock = threading.RLock()
+        # Counts invalidations, so that a value computed meanwhile (eg in
+        # another thread) isn't cached, since it might be stale already
+        self.generation = 0
+        self.hits = self.misses = self.expired = self.evicted = self.dropped = 0
+        CACHES[name] = self
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            return bool(entry) and not self._expired(entry)
+
+    def _expired(self, entry):
+        _, expiry, _ = entry
+        return expiry is not None and time.monotonic() > expiry
+
+    def lookup(self, key, *, count=True):
+        """Returns (hit, value). Set count=False to not count it in the stats"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and self._expired(entry):
+                del self.entries[key]
+                self.expired += count
+                entry = None
+            if not entry:
+                self.misses += count
+                return False, None
+            self.hits += count
+            self.entries.move_to_end(key)
+            return True, entry[0]
+
+    def put(self, key, value, *, tags=(), ttl=None, generation=None):
+        """Unless the cache was invalidated since that `generation`"""
+        ttl = ttl if ttl is not None else self.ttl
+        expiry = ttl and time.monotonic() + ttl
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.entries[key] = (value, expiry, frozenset(tags))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evicted += 1
+
+    def discard(self, key):
+        with self.lock:
+            if self.entries.pop(key, None):
+                self.dropped += 1
+
+    def invalidate(self, *tags):
+        tags = set(tags)
+        with self.lock:
+            self.generation += 1
+            stale = [ k for k, (_, _, t) in self.entries.items() if t & tags ]
+            for key in stale:
+                del self.entries[key]
+            self.dropped += len(stale)
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.dropped += len(self.entries)
+            self.entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size'    : len(self.entries),
+            'hits'    : self.hits,
+            'misses'  : self.misses,
+            'ratio'   : lookups and self.hits / lookups,
+            'expired' : self.expired,
+            'evicted' : self.evicted,
+            'dropped' : self.dropped,
+        }
+
+
+def cached(*, ttl=None, maxsize=128, tags=None):
+    """Decorator to cache the results of a function, cf. Cache
+
+    `tags` is a function, given the same arguments, returning the tags of that
+    result. eg for a function of a deck:
+
+        @cached(ttl=60, tags=lambda deck: deck_tags(deck))
+        def get_something(deck):
+            ...
+    """
+
+    def decorator(func):
+        cache = Cache(func.__name__, ttl=ttl, maxsize=maxsize)
+
+        def call(key, *args, **kwargs):
+            generation = cache.generation
+            value = func(*args, **kwargs)
+            cache.put(
+                key, value,
+                tags=tags(*args, **kwargs) if tags else (),
+                generation=generation,
+            )
+            return value
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            hit, value = cache.lookup(key)
+            if hit:
+                return value
+            return call(key, *args, **kwargs)
+
+        def refresh(*args, **kwargs):
+            """Call it anew, even if cached, and cache that, cf. Refresher"""
+            key = (args, tuple(sorted(kwargs.items())))
+            return call(key, *args, **kwargs)
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        wrapper.refresh = refresh
+        wrapper.tags = tags
+        return wrapper
+    return decorator
+
+
+def deck_tags(deck):
+    """Tags for a deck and its parent decks
+
+    eg 'nl::verbs' => 'deck:nl', 'deck:nl::verbs'
+    Since a search of deck 'nl' also includes the cards of its sub-decks.
+    """
+    parts = deck.split('::')
+    return { 'deck:' + '::'.join(parts[:i]) for i in range(1, len(parts) + 1) }
+
+
+def invalidate(*tags):
+    """Drop all the entries (of any cache) with any of these tags"""
+    logging.debug(f'{tags=}')
+    for cache in CACHES.values():
+        cache.invalidate(*tags)
+    refresher.invalidate(*tags)
+
+
+def changed(*, deck=None, card_id=None, note_id=None):
+    """Invalidate whatever depends on a deck/card/note that was just changed
+
+    A change in a deck also invalidates the entries across all decks ('deck:*')
+    """
+    tags = set()
+    if deck:
+        tags |= deck_tags(deck) | {'deck:*'}
+    if card_id:
+        tags.add(f'card:{card_id}')
+    if note_id:
+        tags.add(f'note:{note_id}')
+    invalidate(*tags)
+
+
+def invalidate_all():
+    for cache in CACHES.values():
+        cache.clear()
+    refresher.invalidate()
+
+
+def cache_report():
+    """One line of hit/miss stats per cache, eg for logging"""
+    lines = []
+    for name, cache in sorted(CACHES.items()):
+        stats = cache.stats()
+        lines += [ ''
+            + f"{name:20s} "
+            + f"size:{stats['size']:6d} "
+            + f"hits:{stats['hits']:6d} "
+            + f"misses:{stats['misses']:6d} "
+            + f"ratio:{stats['ratio']:4.0%} "
+            + f"expired:{stats['expired']:4d} "
+            + f"evicted:{stats['evicted']:4d} "
+            + f"dropped:{stats['dropped']:4d}"
+        ]
+    return '\n'.join(lines)
+
+
+atexit.register(lambda: logging.info('Cache stats:\n' + cache_report()))
+
+
+################################################################################
 
 
 def get_deck_names():
@@ -472,235 +1044,314 @@ def renderer(
     return string
 
 
-def normalizer(
-    string,
-    *,
-    term=None,
-    ):
-    """Converts HTML to text, for saving in Anki DB"""
+# NL-specific (or specific to woorden.org).
+# Topical category names e.g. 'informeel' .
+# Definitions in plain text will often have the tags already stripped out.
+# So, also use this manually curated list. (Each entry is a regex.)
+
+# spell-checker:disable
+CATEGORIES = [
+    *[]
+    # These are just suffixes that mean "study of a(ny) field"
+    ,r'\S+kunde'
+    ,r'\S+ografie'
+    ,r'\S+ologie'
+    ,r'\S+onomie'
+    ,r'\S*techniek'
+    ,r'financ[a-z]+'
+
+    ,'algemeen'
+    ,'ambacht'
+    ,'anatomie'
+    ,'architectuur'
+    ,'cinema'
+    ,'commercie'
+    ,'computers?'
+    ,'constructie'
+    ,'culinair'
+    ,'defensie'
+    ,'educatie'
+    ,'electriciteit'
+    ,'electronica'
+    ,'formeel'
+    ,'geschiedenis'
+    ,'handel'
+    ,'informatica'
+    ,'informeel'
+    ,'internet'
+    ,'juridisch'
+    ,'kunst'
+    ,'landbouw'
+    ,'medisch'
+    ,'metselen'
+    ,'muziek'
+    ,'ouderwets'
+    ,'politiek'
+    ,'religie'
+    ,'scheepvaart'
+    ,'slang'
+    ,'speelgoed'
+    ,'sport'
+    ,'spreektaal'
+    ,'taal'
+    ,'technisch'
+    ,'theater'
+    ,'transport'
+    ,'verkeer'
+    ,'verouderd'
+    ,'visserij'
+    ,'vulgair'
+]
+# spell-checker:enable
+
+# Matches if (any part of) a name is a known category
+CATEGORIES_RE = re.compile('|'.join(CATEGORIES), re.IGNORECASE)
+
+SUP_CATEGORY_RE = re.compile(r'<sup>([a-z]+?)</sup>')
+SUP_WORD_RE = re.compile(r'<sup>(\w+)</sup>')
+
+
+def sup_categories(string):
+    """Format topical categories in <sup> tags as [category]
+
+    cf. new_categories()
+    """
+
+    if SUP_CATEGORY_RE.search(string):
+        string = SUP_WORD_RE.sub(r'[\1]', string)
+    return string
+
+
+def new_categories(string) -> list:
+    """The topical categories in <sup> tags that aren't in the CATEGORIES yet
+
+    If we still have the HTML tags, then we can see if this topic category is
+    new to us. Optionally, it can then be manually added to the CATEGORIES.
+    Otherwise, they wouldn't be detected in old cards, if it's not already in
+    [brackets] .
+    """
+
+    # If this is a known category, it's already formatted as such.
+    # (We're doing a regex match here; a category name might be a regex.)
+    return [
+        category for category in SUP_CATEGORY_RE.findall(string)
+        if not CATEGORIES_RE.search(category)
+    ]
+
 
+def notify_categories(categories):
+    """Notify, so you can (manually) add these to the CATEGORIES"""
+    for category in categories:
+        print(f"\nNew category [" + W(C.WARN, category) + "]\n",)
+        beep()
+
+
+# The steps of the normalizer(), in order. Each is either a regex substitution
+# (pattern, replacement), or a function of the string.
+NORMALIZER_STEPS = [
     # Specific to woorden.org
     # Before unescaping HTML entities: Replace (&lt; and &gt;) with ( and )
-    string = re.sub(r'&lt;|《', '(', string)
-    string = re.sub(r'&gt;|》', ')', string)
-    string = re.sub(r'&nbsp;', ' ', string)
+    (r'&lt;|《', '('),
+    (r'&gt;|》', ')'),
+    (r'&nbsp;', ' '),
     # Other superfluous chars:
-    string = re.sub(r'《/?em》|«|»', '', string)
+    (r'《/?em》|«|»', ''),
 
     # Replace HTML entities with unicode chars (for IPA symbols, etc)
-    string = html.unescape(string)
+    html.unescape,
 
     # Remove tags that are usually inside the IPA/phonetic markup
-    string = re.sub(r'</?a\s+.*?>', '', string)
+    (r'</?a\s+.*?>', ''),
 
     # Replace IPA stress marks that are not commonly represented in fonts.
     # IPA Primary Stress Mark   (Unicode U+02C8) ie the [ˈ] character => apostrophe [']
     # IPA Secondary Stress Mark (Unicode U+02CC) ie the [ˌ] character => comma [,]
     # IPA Long vowel length     (Unicode U+02D0) ie the [ː] character => colon [:]
-    # eg for the NL word "apostrof", change the IPA: [ ˌapɔsˈtrɔf ] => [ ,apɔs'trɔf ]
-    string = re.sub(r'\u02C8', "'", string)
-    string = re.sub(r'\u02CC', ",", string)
-    string = re.sub(r'\u02D0', ":", string)
+    # eg for the NL word "apostrof", change the IPA: [ ˌapɔsˈtrɔf ] => [ ,apɔs'trɔf ]
+    (r'\u02C8', "'"),
+    (r'\u02CC', ","),
+    (r'\u02D0', ":"),
 
     # Remove numeric references like [3]; we probably don't have the footnotes anyway
-    string = re.sub(r'\[\d+\]', '', string)
+    (r'\[\d+\]', ''),
 
     # NL-specific (or specific to woorden.org).
     # Segregate topical category names e.g. 'informeel' .
-    # Definitions in plain text will often have the tags already stripped out.
-    # So, also use this manually curated list.
-
-    # spell-checker:disable
-    categories = [
-        *[]
-        # These are just suffixes that mean "study of a(ny) field"
-        ,r'\S+kunde'
-        ,r'\S+ografie'
-        ,r'\S+ologie'
-        ,r'\S+onomie'
-        ,r'\S*techniek'
-        ,r'financ[a-z]+'
-
-        ,'algemeen'
-        ,'ambacht'
-        ,'anatomie'
-        ,'architectuur'
-        ,'cinema'
-        ,'commercie'
-        ,'computers?'
-        ,'constructie'
-        ,'culinair'
-        ,'defensie'
-        ,'educatie'
-        ,'electriciteit'
-        ,'electronica'
-        ,'formeel'
-        ,'geschiedenis'
-        ,'handel'
-        ,'informatica'
-        ,'informeel'
-        ,'internet'
-        ,'juridisch'
-        ,'kunst'
-        ,'landbouw'
-        ,'medisch'
-        ,'metselen'
-        ,'muziek'
-        ,'ouderwets'
-        ,'politiek'
-        ,'religie'
-        ,'scheepvaart'
-        ,'slang'
-        ,'speelgoed'
-        ,'sport'
-        ,'spreektaal'
-        ,'taal'
-        ,'technisch'
-        ,'theater'
-        ,'transport'
-        ,'verkeer'
-        ,'verouderd'
-        ,'visserij'
-        ,'vulgair'
-    ]
-    # spell-checker:enable
-
-    # If we still have the HTML tags, then we can see if this topic category is
-    # new to us. Optionally, it can then be manually added to the list above.
-    # Otherwise, they wouldn't be detected in old cards, if it's not already in
-    # [brackets] .
-    for match in re.findall(r'<sup>([a-z]+?)</sup>', string) :
-        category = match
-        # logging.debug(f'{category=}')
-        # If this is a known category, just format it as such.
-        # (We're doing a regex match here; a category name might be a regex.)
-        string = re.sub(r'<sup>(\w+)</sup>', r'[\1]', string)
-        if any([ re.search(c, category, re.IGNORECASE) for c in categories ]):
-            ...
-        else:
-            # Notify, so you can (manually) add this one to the 'categories'
-            # list above.
-            print(f"\nNew category [" + W(C.WARN, category) + "]\n",)
-            beep()
-            # time.sleep(5)
+    sup_categories,
 
     # Replace remaining <sup> tags
-    string = re.sub(r'<sup>', r'^', string)
+    (r'<sup>', r'^'),
 
     # Specific to: PONS Großwörterbuch Deutsch als Fremdsprache
-    string = re.sub('<span class="illustration">', '\n', string)
+    ('<span class="illustration">', '\n'),
 
     # Specific to fr.thefreedictionary.com (Maxipoche 2014 © Larousse 2013)
-    string = re.sub('<span class="Ant">', '\nantonyme: ', string)
-    string = re.sub('<span class="Syn">', '\nsynonyme: ', string)
+    ('<span class="Ant">', '\nantonyme: '),
+    ('<span class="Syn">', '\nsynonyme: '),
 
     # Specific to en.thefreedictionary.com
     # (American Heritage® Dictionary of the English Language)
-    string = re.sub(r'<span class="pron".*?</span>', '', string)
+    (r'<span class="pron".*?</span>', ''),
     # Replace headings that just break up the word into syl·la·bles,
     # since we get that from IPA already
-    string = re.sub(r'<h2>.*?·.*?</h2>', '', string)
+    (r'<h2>.*?·.*?</h2>', ''),
     # For each new part-of-speech block
-    string = re.sub(r'<div class="pseg">', '\n\n', string)
+    (r'<div class="pseg">', '\n\n'),
 
     # Add spaces around em dash — for readability
-    string = re.sub(r'(\S)—(\S)', r'\1 — \2', string)
+    (r'(\S)—(\S)', r'\1 — \2'),
 
     # HTML-specific:
     # Remove span/font tags, so that the text can stay on one line
-    string = re.sub(r'<span\s+.*?>', '', string)
-    string = re.sub(r'<font\s+.*?>', '', string)
+    (r'<span\s+.*?>', ''),
+    (r'<font\s+.*?>', ''),
     # These HTML tags <i> <b> <u> <em> are usually used inline and should not
     # have a line break (below, we replace remaining tags with \n ...)
-    string = re.sub(r'<(i|b|u|em)>', '', string)
+    (r'<(i|b|u|em)>', ''),
 
-    string = re.sub(r'<br\s*/?>', '\n\n', string)
-    string = re.sub(r'<hr.*?>', '\n\n___\n\n', string)
+    (r'<br\s*/?>', '\n\n'),
+    (r'<hr.*?>', '\n\n___\n\n'),
 
     # Headings on their own line, by replacing the closing tag with \n
-    string = re.sub(r'</h\d>\s*', '\n', string)
+    (r'</h\d>\s*', '\n'),
 
     # Tables, with \n\n between rows
-    string = re.sub(r'<td.*?>', '', string)
-    string = re.sub(r'<tr.*?>', '\n\n', string)
+    (r'<td.*?>', ''),
+    (r'<tr.*?>', '\n\n'),
 
     # Replace remaining opening tags with a newline, since usually a new section
-    string = re.sub(r'<[^/].*?>', '\n', string)
+    (r'<[^/].*?>', '\n'),
     # Remove remaining (closing) tags
-    string = re.sub(r'<.*?>', '', string)
+    (r'<.*?>', ''),
 
     # Segregate pre-defined topical category names
     # Wrap in '[]', the names of topical fields.
     # (when it's last (and not first) on the line)
-    categories_re = '|'.join(categories)
-    string = re.sub(f'(?m)(?<!^)\\s+({categories_re})$', r' [\1]', string)
+    (f'(?m)(?<!^)\\s+({"|".join(CATEGORIES)})$', r' [\1]'),
 
     # Non-HTML-specific:
     # Collapse sequences of space/tab chars
-    string = re.sub(r'\t', ' ', string)
-    string = re.sub(r' {2,}', ' ', string)
+    (r'\t', ' '),
+    (r' {2,}', ' '),
 
     # NL-specific (or specific to woorden.org)
-    string = re.sub(r'Toon alle vervoegingen', '', string)
+    (r'Toon alle vervoegingen', ''),
     # Remove hover tip on IPA pronunciation
-    string = re.sub(r'(?s)<a class="?help"? .*?>', '', string)
+    (r'(?s)<a class="?help"? .*?>', ''),
     # Ensure headings begin on their own line
     # (also covers plural forms, eg "Synoniemen")
-    string = re.sub(
+    (
         r'(?m)(?<!^)(Afbreekpatroon|Uitspraak|Vervoeging|Verbuiging|Synoniem|Antoniem)',
         r'\n\1',
-        string
-    )
+    ),
 
     # NL-specific: Newlines (just one) before example `phrases in backticks`
     # (but not *after*, else you'd get single commas on a line, etc)
-    string = re.sub(r'(?m)(?:\n*)(`.*?`)', r'\n\1', string)
+    (r'(?m)(?:\n*)(`.*?`)', r'\n\1'),
 
     # One, and only one, newline \n after colon :
     # (but only if the colon : is not already inside of a (short) parenthetical)
-    string = re.sub(r'(?m):([\s\n]+)(?![^(]{,20}\))', r':\n', string)
+    (r'(?m):([\s\n]+)(?![^(]{,20}\))', r':\n'),
 
     # Remove seperators in plurals (eg in the section: "Verbuigingen")
-    string = re.sub(r'\|', '', string)
+    (r'\|', ''),
 
     # Ensure 1) and 2) sections start a new paragraph
-    string = re.sub(r'(?m)^(\d+\))', r'\n\n\1', string)
+    (r'(?m)^(\d+\))', r'\n\n\1'),
     # Ensure new sections start a new paragraph, eg I. II. III. IV.
-    string = re.sub(r'(?m)^(I{1,3}V?\s+)', r'\n\n\1', string)
+    (r'(?m)^(I{1,3}V?\s+)', r'\n\n\1'),
 
     # DE-specific:
     # Ensure new sections start a new paragraph, eg I. II. III. IV.
-    string = re.sub(r'\s+(I{1,3}V?\.)', r'\n\n\1', string)
+    (r'\s+(I{1,3}V?\.)', r'\n\n\1'),
     # New paragraph for each definition on the card, marked by eg: ...; 1. ...
-    string = re.sub(r';\s*(\d+\. +)', r'\n\n\1', string)
-    string = re.sub(r'(?m)^\s*(\d+\. +)', r'\n\n\1', string)
+    (r';\s*(\d+\. +)', r'\n\n\1'),
+    (r'(?m)^\s*(\d+\. +)', r'\n\n\1'),
     # And sub-definitions, also indented, marked by eg: a) or b)
-    string = re.sub(r';?\s+([a-z]\) +)', r'\n  \1', string)
+    (r';?\s+([a-z]\) +)', r'\n  \1'),
     # Newline after /slashes/ often used as context, if at the start of the line
-    string = re.sub(r'(?m)^\s*(/.*?/)\s*', r'\1\n', string)
+    (r'(?m)^\s*(/.*?/)\s*', r'\1\n'),
 
     # Max 2x newlines in a row
-    string = re.sub(r'(\s*\n\s*){3,}', '\n\n', string)
+    (r'(\s*\n\s*){3,}', '\n\n'),
 
     # Delete leading/trailing space on each line
-    string = re.sub(r'(?m)^ +', '', string)
-    string = re.sub(r'(?m) +$', '', string)
+    (r'(?m)^ +', ''),
+    (r'(?m) +$', ''),
 
     # Delete leading space on the entry as a whole
-    string = re.sub(r'^\s+', '', string)
+    (r'^\s+', ''),
+]
+# Compiled once, rather than on each call
+NORMALIZER_STEPS = [
+    step if callable(step) else (re.compile(step[0]), step[1])
+    for step in NORMALIZER_STEPS
+]
+
+TRAILING_SPACE_RE = re.compile(r'\s*$')
+
+
+@cached(maxsize=100)
+def term_prefix_re(term):
+    """The redundant term at the start of an entry, cf. normalizer()"""
+    return re.compile(r'^\s*' + term + r'\s+')
+
+
+def normalizer(
+    string,
+    *,
+    term=None,
+    notify=notify_categories,
+    ):
+    """Converts HTML to text, for saving in Anki DB
+
+    cf. NORMALIZER_STEPS
+
+    Any new categories are passed to `notify` (unless None, eg in the
+    background), once HTML entities have been unescaped, cf. new_categories()
+    """
+
+    for step in NORMALIZER_STEPS:
+        if step is sup_categories and notify:
+            notify(new_categories(string))
+        if callable(step):
+            string = step(string)
+        else:
+            pattern, replacement = step
+            string = pattern.sub(replacement, string)
 
     # Strip redundant term at start of card, if it's a whole word, non-prefix
     if term:
-        string = re.sub(r'^\s*' + term + r'\s+', r'', string)
+        string = term_prefix_re(term).sub(r'', string)
 
     # Delete trailing space, and add canonical final newline
-    string = re.sub(r'\s*$', '', string)
+    string = TRAILING_SPACE_RE.sub('', string)
     if string != '':
         string = string + '\n'
 
     return string
 
 
+@cached(maxsize=32)
+def get_stemmer(deck):
+    """The SnowballStemmer for the language of this deck, if any"""
+
+    # Map e.g. 'de' to 'german', as required by SnowballStemmer
+    if deck and deck in iso639.languages.part1:
+        from nltk.stem.snowball import SnowballStemmer
+        lang = iso639.languages.get(part1=deck).name.lower()
+        return SnowballStemmer(lang)
+
+
+@cached(maxsize=1000)
+def unidecoded(string):
+    return unidecode.unidecode(string)
+
+
+# Lines listing the inflected forms, in an entry (from woorden.org)
+INFLECTIONS_RE = re.compile(r'(?m)^\s*(?:Vervoegingen|Verbuigingen):\s*(.*?)\s*$')
+
+
 def highlighter(
     string,
     query,
@@ -709,6 +1360,121 @@ def highlighter(
     deck=None,
     ):
 
+    # Other than the query/term/deck, the highlights only depend on the listed
+    # inflections. So, the patterns are reused when (re-)rendering a card.
+    inflections = ()
+    if deck == 'nl':
+        inflections = tuple(INFLECTIONS_RE.findall(string))
+    highlight_re, highlight_re_decoded = highlight_patterns(
+        query, term=term, deck=deck, inflections=inflections
+    )
+
+    # Highlight accent-insensitive:
+    # Start on a copy without accents:
+    string_decoded = unidecoded(string)
+    # NB, the string length will be the same if accents are simply removed.
+    # However, chars like the German 'ß' could make the decoded longer.
+    # So, first test if it's safe to use this position-based approach:
+    if len(string) == len(string_decoded):
+        # Get all match position intervals (half-open intervals)
+        i = highlight_re_decoded.finditer(string_decoded)
+        spans = [m.span() for m in i]
+        l = list(string)
+        # Process the string back-to-front, since inserting changes indexes
+        for t in reversed(spans):
+            x,y = t
+            # Also, here, y before x, since back-to-front
+            l.insert(y, C.NONE)
+            l.insert(x, C.HIGH)
+
+        string = ''.join(l)
+    else:
+        # We can't do accent-insensitive hightlighting.
+        # Just do case-insensitive highlighting.
+        string = highlight_re.sub(C.HIGH + r'\1' + C.NONE, string)
+
+    return string
+
+
+def inflected_forms(inflections, *, term):
+    """The forms listed on the inflection lines of an entry (NL-specific)
+
+    eg 'Verbuigingen: bestek|ken (meervoud)' => 'bestekken'
+
+    Alternative forms stay comma-separated, eg 'waarden, waardes' (of waarde).
+    cf. INFLECTIONS_RE, highlight_patterns(), card_inflections()
+    """
+
+    matches = []
+    # Theoretically, we could avoid a double loop here, but this makes it
+    # easier to read. There can be multiple inflections in one line (eg
+    # prijzen), so it's easier to have two loops.
+    # (The inflections are the lines cf. INFLECTIONS_RE)
+    for inflection in inflections:
+        # There is not always a parenthetical part-of-speech after the
+        # inflection of plurals. Sometimes it's just eol (eg "nederlaag") .
+        # So, it ends either with eol $ or open paren (
+        match = re.findall(r'(?s)(?:\)|^)\s*(.+?)\s*(?:\(|$)', inflection)
+        matches += match
+
+    for match in matches:
+
+        # Remove separators, e.g. in "Verbuigingen: uitlaatgas|sen (...)"
+        match = re.sub(r'\|', '', match)
+
+        # If past participle, remove the 'is' or 'heeft'
+        # Sometimes as eg:
+        # uitrusten: 'is, heeft uitgerust' or 'heeft, is uitgerust'
+        match = re.sub(r'^(is|heeft)(,\s+(is|heeft))?\s+', '', match)
+        # And the reflexive portion 'zich' isn't necessary, eg: "begeven"
+        match = re.sub(r'\bzich\b', '', match)
+
+        # This is for descriptions with a placeholder char like:
+        # "kind": "Verbuigingen: -eren" => "kinderen"
+        # "homo": "'s" => "homo's"
+        match = re.sub(r"^[-'~]", term, match)
+
+        if ',' not in match:
+            # Collapse spaces, and trim
+            match = re.sub(r'\s+', ' ', match)
+            match = match.strip()
+
+        yield match
+
+
+def card_inflections(front, back) -> set:
+    """The (casefolded) inflected forms listed on the back of a card
+
+    For searching by an inflected form, eg 'bestekken', cf. Mirror.inflected()
+    """
+
+    # Most cards don't list any, so skip normalizing those
+    if not re.search(r'Vervoeging|Verbuiging', back):
+        return set()
+    # Quietly, since the card isn't being shown. And escaped, since the term
+    # is a regex there, and a front can be anything, eg 'iets (doen'
+    string = normalizer(back, term=re.escape(front), notify=None)
+    forms = set()
+    for match in inflected_forms(INFLECTIONS_RE.findall(string), term=front):
+        for form in re.split(r',\s*', match):
+            form = re.sub(r'\s+', ' ', form).strip().casefold()
+            # Also after a comma, eg 'zag, heeft gezien' or 'rustte uit, is, heeft uitgerust'
+            form = re.sub(r'^(is|heeft)\b\s*', '', form)
+            forms.add(form)
+            # Separable verbs, eg 'stortte ineen', also by just 'stortte'
+            if separable := re.fullmatch(r'(\S+) \S+', form):
+                forms.add(separable[1])
+    forms -= { '', front.casefold() }
+    return forms
+
+
+@cached(maxsize=1000)
+def highlight_patterns(query, *, term='', deck=None, inflections=()):
+    """Compiled patterns of all the forms to highlight, for highlighter()
+
+    Returns the case-insensitive pattern, and its accent-insensitive version.
+    """
+
     # Map wildcard search chars to regex syntax
     query = re.sub(r'[.]', r'\.', query)
     query = re.sub(r'[_]', r'.', query)
@@ -745,10 +1511,7 @@ def highlighter(
     # TODO also factor out the stemming (separate from highlighting, since lang-specific)
     # NB, this stemming isn't that reliable, eg
     # fr/fendre => 'fendr' (but should be 'fend')
-    # Map e.g. 'de' to 'german', as required by SnowballStemmer
-    if deck and deck in iso639.languages.part1:
-        lang = iso639.languages.get(part1=deck).name.lower()
-        stemmer = SnowballStemmer(lang)
+    if stemmer := get_stemmer(deck):
         stem = stemmer.stem(term_or_query)
         if stem != term_or_query:
             highlights.add(stem)
@@ -767,48 +1530,13 @@ def highlighter(
             highlights.add( re.sub(r'eus$', r'euz\\S*', term_or_query) )
 
         # Find given inflections listed in the definition/entry
-
-        matches = []
-        # Theoretically, we could avoid a double loop here, but this makes it
-        # easier to read. There can be multiple inflections in one line (eg
-        # prijzen), so it's easier to have two loops.
-        inflections = re.findall(
-            r'(?m)^\s*(?:Vervoegingen|Verbuigingen):\s*(.*?)\s*$',
-            string
-        )
-        for inflection in inflections:
-            # There is not always a parenthetical part-of-speech after the
-            # inflection of plurals. Sometimes it's just eol (eg "nederlaag") .
-            # So, it ends either with eol $ or open paren (
-            match = re.findall(r'(?s)(?:\)|^)\s*(.+?)\s*(?:\(|$)', inflection)
-            matches += match
-
-        for match in matches:
-
-            # Remove separators, e.g. in "Verbuigingen: uitlaatgas|sen (...)"
-            match = re.sub(r'\|', '', match)
-
-            # If past participle, remove the 'is' or 'heeft'
-            # Sometimes as eg:
-            # uitrusten: 'is, heeft uitgerust' or 'heeft, is uitgerust'
-            match = re.sub(r'^(is|heeft)(,\s+(is|heeft))?\s+', '', match)
-            # And the reflexive portion 'zich' isn't necessary, eg: "begeven"
-            match = re.sub(r'\bzich\b', '', match)
-
-            # This is for descriptions with a placeholder char like:
-            # "kind": "Verbuigingen: -eren" => "kinderen"
-            # "homo": "'s" => "homo's"
-            match = re.sub(r"^[-'~]", term_or_query, match)
+        for match in inflected_forms(inflections, term=term_or_query):
 
             # plural nouns with multiple declensions, CSV
             # eg waarde => waarden, waardes
             if ',' in match:
                 highlights.update(re.split(r',\s*', match))
-                match = ''
-
-            # Collapse spaces, and trim
-            match = re.sub(r'\s+', ' ', match)
-            match = match.strip()
+                continue
 
             # Hack stemming for infinitive forms with a consonant change in
             # simple past tense:
@@ -871,39 +1599,13 @@ def highlighter(
     # i.e. this will prefer matching 'kinderen' before 'kind'
     highlight_re = '|'.join(reversed(sorted(highlights, key=len)))
 
-    # Highlight accent-insensitive:
-    # Start on a copy without accents:
-    string_decoded = unidecode.unidecode(string)
-    # NB, the string length will be the same if accents are simply removed.
-    # However, chars like the German 'ß' could make the decoded longer.
-    # So, first test if it's safe to use this position-based approach:
-    if len(string) == len(string_decoded):
-        # And the terms to highlight need to be normalized then too:
-        highlight_re_decoded = unidecode.unidecode(highlight_re)
-        # Get all match position intervals (half-open intervals)
-        i = re.finditer(f"(?i:{highlight_re_decoded})", string_decoded)
-        spans = [m.span() for m in i]
-        l = list(string)
-        # Process the string back-to-front, since inserting changes indexes
-        for t in reversed(spans):
-            x,y = t
-            # Also, here, y before x, since back-to-front
-            l.insert(y, C.NONE)
-            l.insert(x, C.HIGH)
-
-        string = ''.join(l)
-    else:
-        # We can't do accent-insensitive hightlighting.
-        # Just do case-insensitive highlighting.
-        # NB, the (?i:...) doesn't create a group.
-        # That's why ({highlight}) needs it's own parens here.
-        string = re.sub(
-            f"(?i:({highlight_re}))",
-            C.HIGH + r'\1' + C.NONE,
-            string
-        )
-
-    return string
+    # NB, the (?i:...) doesn't create a group.
+    # That's why ({highlight}) needs it's own parens here.
+    # And the terms to highlight need to be normalized for the decoded string.
+    return (
+        re.compile(f"(?i:({highlight_re}))"),
+        re.compile(f"(?i:{unidecode.unidecode(highlight_re)})"),
+    )
 
 
 def get_url(term, *, lang):
@@ -911,48 +1613,210 @@ def get_url(term, *, lang):
 
     quoted = parse.quote(term) # URL quoting
 
-    # TODO could perhaps generalize this further into a list or (per-lang) providers
-    # That would provide both source URLs, as well as parsing rules for the response
+    # The providers (cf. Provider) fetch from these too, by key
     url = {}
     url['google'] = f'https://google.com/search?q={quoted}'
     url['freedictionary'] = f'https://{lang}.thefreedictionary.com/{quoted}'
     url['wiktionary'] = f'https://{lang}.wiktionary.org/wiki/{quoted}'
+    if lang == 'nl':
+        url['woorden'] = f'http://www.woorden.org/woord/{quoted}'
 
     # TODO add lang-specific dicts ?
-    # TODO add a default per language, eg 'nl' aliases to 'woorden'
 
     return url
 
 
-def search(term, *, lang):
-    """...
+def search(term, *, lang, refresh=False, found=None):
+    """Look up a term in (each of) the dictionary providers of this lang/deck
+
+    Several providers are queried concurrently. Returns a dict with the
+    'definition' (the sections of each provider, in the order they arrived, ie
+    fastest first, separated by <hr>) and the 'suggestions' (of all).
 
+    `found`, if given, is called with the merged result so far, each time
+    another provider has returned. cf. Fetch
+
+    Set refresh to re-fetch, rather than use the page_cache.
     """
-    obj = {}
 
-    if lang == 'nl':
-        content = search_woorden(term)
-        obj['definition'] = content
-        return obj
+    if not term or '*' in term:
+        return {}
+    providers = deck_providers(lang)
+
+    results = queue.Queue()
+    def run(provider):
+        results.put(provider.search(term, lang=lang, refresh=refresh))
+
+    if len(providers) == 1:
+        run(providers[0])
+    else:
+        for provider in providers:
+            threading.Thread(
+                target=run, args=(provider,), name=f'{provider.name}:{term}', daemon=True
+            ).start()
 
-    obj = search_thefreedictionary(term, lang=lang)
+    definitions = []
+    suggestions = set()
+    obj = {}
+    for _ in providers:
+        result = results.get() or {}
+        if result.get('definition'):
+            definitions.append(result['definition'])
+        suggestions.update(result.get('suggestions') or [])
+        obj = {
+            'definition': '<hr>'.join(definitions) or None,
+            'suggestions': sorted(suggestions, key=str.casefold),
+        }
+        if found:
+            found(obj)
     return obj
 
 
-def search_anki(
-    query,
-    *,
-    deck,
-    wild=False,
-    field='front',
-    browse=False,
-    term='',
-    ):
-    """Local search of Anki"""
+class Fetch:
+    """A search() of the remote dictionary, running in a background thread
+
+    So that the menu stays responsive meanwhile. `key` is the command that
+    started it, and `context` is whatever that command needs to handle the
+    result, once done(), cf. main().
+
+    There's no way to interrupt urlopen(), so cancelling just means dropping
+    the Fetch; the thread still ends within options.timeout.
+    """
+
+    def __init__(self, term, *, lang, key, refresh=False, **context):
+        self.term = term
+        self.lang = lang
+        self.key = key
+        self.refresh = refresh
+        self.context = context
+        # The (merged) result so far, while the providers come in, cf. search()
+        self.result = None
+        self.version = self.seen = 0
+        self.start = time.monotonic()
+        self.finished = threading.Event()
+        thread = threading.Thread(target=self.run, name=f'fetch:{term}', daemon=True)
+        thread.start()
+
+    def run(self):
+        try:
+            search(self.term, lang=self.lang, refresh=self.refresh, found=self.found)
+        except Exception as e:
+            logging.warning(e)
+        finally:
+            self.finished.set()
+
+    def found(self, obj):
+        self.result = obj
+        self.version += 1
+
+    def done(self):
+        return self.finished.is_set()
+
+    def fresh(self):
+        """Whether there's a result (from another provider) not yet seen"""
+        return self.version > self.seen
+
+    def see(self):
+        """The result so far, marked as seen"""
+        self.seen = self.version
+        return self.result
+
+    def progress(self):
+        elapsed = time.monotonic() - self.start
+        return W(C.INFO, f"Fetching: {self.term} ... {elapsed:.1f}s (Esc to cancel)")
+
+
+class Prefill:
+    """Fetch the definitions of many terms concurrently, eg of all the empties
+
+    A bounded number of (daemon) worker threads take terms from a queue. The
+    results of search() are staged in `results`, by term, (and the pages in
+    the page_cache). So that going through them afterwards, eg via 'm', doesn't
+    wait on the network. cf. fill_empties()
+    """
+
+    def __init__(self, terms, *, lang, workers=4):
+        self.lang = lang
+        self.terms = list(dict.fromkeys(terms))
+        # term => search() result (None, if that failed)
+        self.results = {}
+        self.queue = queue.Queue()
+        for term in self.terms:
+            self.queue.put(term)
+        for i in range(min(workers, len(self.terms))):
+            thread = threading.Thread(target=self.work, name=f'prefill:{i}', daemon=True)
+            thread.start()
+
+    def work(self):
+        while True:
+            try:
+                term = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result = search(term, lang=self.lang)
+            except Exception as e:
+                logging.warning(e)
+                result = None
+            self.results[term] = result
+
+    def done(self):
+        return len(self.results) >= len(self.terms)
+
+    def cancel(self):
+        """Skip the terms not yet being fetched"""
+        while True:
+            try:
+                term = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            self.results[term] = None
+
+    def progress(self):
+        found = sum(bool(obj and obj.get('definition')) for obj in list(self.results.values()))
+        return W(C.INFO, f"Prefetched: {len(self.results)}/{len(self.terms)} (found: {found})")
+
+
+# Beyond this many variants (ie 2**6 double letters) the rest is dropped, for
+# both Anki and the mirror, cf. search_variants()
+VARIANTS_MAX = 64
+
+
+def variant_parts(query, *, deck):
+    """Split a query into literal parts, and the runs of a letter in between
+
+    ie [literal, run, literal, run, ..., literal], where each (odd) run is a
+    letter repeated (2 or more times), that may be collapsed (NL-specific).
+    cf. search_variants()
+    """
 
     # If term contains whitespace, either must quote the whole thing, or replace
     # spaces:
     search_query = re.sub(r' ', '_', query) # For Anki searches
+    if deck != 'nl':
+        return [search_query]
+    parts = re.split(r'((\p{L})\2+)', search_query)
+    # Without the (inner) group of the letter itself
+    return [ part for i, part in enumerate(parts) if i % 3 != 2 ]
+
+
+def reductions(caps, total):
+    """Each way to shorten runs by `total` letters, each by at most its cap"""
+    if total > sum(caps):
+        return
+    if not caps:
+        yield ()
+        return
+    for n in range(min(caps[0], total) + 1):
+        for rest in reductions(caps[1:], total - n):
+            yield (n, *rest)
+
+
+def search_variants(query, *, deck):
+    """The search term(s) to search for, for a given query, in Anki syntax
+
+    cf. anki_query(), Mirror.search()
+    """
 
     # TODO accent-insensitive search?
     # eg exploit should find geëxploiteerd
@@ -962,21 +1826,70 @@ def search_anki(
     # Or see how it's being done inside this add-on:
     # https://ankiweb.net/shared/info/1924690148
 
-    search_terms = [search_query]
-
     # Collapse double letters \p{L} into a disjunction, eg: (NL-specific)
     # This implies that the user should, when in doubt, use double chars to search
     # deck:nl (front:maaken OR front:maken)
     # or use a re: (but that doesn't seem to work)
-    # BUG: this isn't a proper Combination (maths), so it misses some cases
+    # Every combination of (partly) collapsed runs, starting with the query
+    # itself. ie a run of n letters is any of 1..n letters, eg 'zeeeend' can be
+    # 'zeeend', 'zeend' or 'zend'.
     # TODO consider a stemming library here?
-    if deck == 'nl':
-        while True:
-            next_term = re.sub(r'(\p{L})\1', r'\1', search_query, count=1)
-            if next_term == search_query:
-                break
-            search_terms += [next_term]
-            search_query = next_term
+    parts = variant_parts(query, deck=deck)
+    runs, literals = parts[1::2], parts[2::2]
+    # How many letters each run can lose, and all of them
+    caps = [ len(run) - 1 for run in runs ]
+    most = sum(caps)
+    # By the number of letters removed, from both ends: none, all, one, all
+    # but one, etc. So that, if capped, the likeliest ones are still included.
+    order = sorted(range(most + 1), key=lambda n: min(n, most - n))
+    if math.prod(cap + 1 for cap in caps) > VARIANTS_MAX:
+        logging.warning(f'{query}: too many variants, only using {VARIANTS_MAX}')
+    search_terms = {}
+    for total in order:
+        for removed in reductions(caps, total):
+            term = parts[0] + ''.join(
+                run[n:] + literal for run, n, literal in zip(runs, removed, literals)
+            )
+            search_terms[term] = None
+            if len(search_terms) == VARIANTS_MAX:
+                return list(search_terms)
+    return list(search_terms)
+
+
+def variants_re(query, *, deck):
+    """A (casefolded) regex matching exactly the search_variants() of a query
+
+    ie with Anki's wildcards. Built from those, so that the mirror matches the
+    same variants as Anki, also when capped. To filter the candidates of a
+    lookup by squeeze() key. cf. Mirror
+    """
+
+    pattern = '|'.join(
+        re.escape(term.casefold()).replace(r'\*', '.*').replace('_', '.')
+        for term in search_variants(query, deck=deck)
+    )
+    return compiled(f'(?:{pattern})', re.DOTALL)
+
+
+def squeeze(term):
+    """Squeeze each run of a repeated letter into one, eg 'maaken' -> 'maken'
+
+    All the search_variants() of a (literal) query have the same key.
+    """
+    return re.sub(r'(\p{L})\1+', r'\1', term)
+
+
+def anki_query(
+    query,
+    *,
+    deck,
+    wild=False,
+    field='front',
+    ):
+    """Build the Anki search query string for a search term, cf. search_anki()
+    """
+
+    search_terms = search_variants(query, deck=deck)
 
     if field:
         if wild:
@@ -1002,8 +1915,37 @@ def search_anki(
         # TODO since we parse these out from the highlighter() (if it's
         # reliable), we could (auto?) add these as tags to the cards, and then
         # also search the tags (?)
+        # (With the mirror, they're indexed instead, cf. card_inflections())
 
     search_query = f'deck:{deck} (' + ' OR '.join([*search_terms]) + ')'
+    return search_query
+
+
+def search_anki(
+    query,
+    *,
+    deck,
+    wild=False,
+    field='front',
+    browse=False,
+    term='',
+    inflected=True,
+    ):
+    """Local search of Anki
+
+    Uses the local mirror, if enabled, cf. Mirror. Which also falls back to the
+    cards listing the query as an inflected form, if nothing else matched the
+    front exactly (unless `inflected=False`), cf. Mirror.inflected()
+    """
+
+    if mirror and not browse:
+        card_ids = mirror.search(query, deck=deck, wild=wild, field=field)
+        if card_ids == [] and inflected and field == 'front' and not wild:
+            card_ids = mirror.inflected(query, deck=deck)
+        if card_ids is not None:
+            return card_ids
+
+    search_query = anki_query(query, deck=deck, wild=wild, field=field)
     logging.debug(f'{query=}')
 
     if browse:
@@ -1019,48 +1961,127 @@ def search_anki(
     return card_ids
 
 
-@functools.lru_cache(maxsize=10)
-def get_new(deck, ts=None):
+def search_combined(query, *, deck):
+    """The exact matches (on the front), and the count of the other matches
+
+    Falling back to the inflected forms, like search_anki(), with the mirror.
+
+    ie returns (card_ids, wild_n), where wild_n counts the cards that match the
+    query anywhere (cf. `field=None` of search_anki()), but not exactly. Just
+    the count, since that's all that's shown, until 'w' lists them.
+
+    In one round-trip, or from one scan of the mirror, if enabled.
+    """
+
+    if mirror and (found := mirror.search_combined(query, deck=deck)) is not None:
+        return found
+
+    exact_query = anki_query(query, deck=deck)
+    wild_query = anki_query(query, deck=deck, field=None)
+    batch = Batch()
+    exact_i = batch.add('findCards', query=exact_query)
+    # The wildcard matches, minus the exact ones, cf. anki_query()
+    others_i = batch.add(
+        'findCards', query=wild_query + ' -' + exact_query.split(' ', 1)[1]
+    )
+    results = batch.send()
+    return results[exact_i] or [], len(results[others_i] or [])
+
+
+class CardState(enum.StrEnum):
+    NEW    = 'new'
+    LEARN  = 'learn'
+    REVIEW = 'review'
+
+
+class StateIndex:
+    """The (scheduling) state of each card in a deck, by card ID
+
+    Built from one batch of `findCards` queries (cf. get_menu_state()), so
+    lookups need neither a request, nor a scan of a list of card IDs.
+
+    The states are disjunct:
+    * new cards:         `is:new`
+    * learn(ing) cards:  `is:due  is:learn`
+    * review(ing) cards: `is:due -is:learn`
+    Cards in none of these (eg not due yet) have no state here.
+    """
+
+    def __init__(self, new=(), learning=(), reviewing=()):
+        # The ordered lists are kept, eg for the order of a review
+        self.new = list(new)
+        self.learning = list(learning)
+        self.reviewing = list(reviewing)
+        self.states = {
+            **dict.fromkeys(self.new, CardState.NEW),
+            **dict.fromkeys(self.learning, CardState.LEARN),
+            **dict.fromkeys(self.reviewing, CardState.REVIEW),
+        }
+
+    def state(self, card_id) -> Optional[CardState]:
+        return self.states.get(card_id)
+
+    def is_new(self, card_id):
+        return self.states.get(card_id) == CardState.NEW
+
+    def is_learn(self, card_id):
+        return self.states.get(card_id) == CardState.LEARN
+
+    def is_review(self, card_id):
+        return self.states.get(card_id) == CardState.REVIEW
+
+    def is_due(self, card_id):
+        return self.states.get(card_id) in (CardState.LEARN, CardState.REVIEW)
+
+    @property
+    def due(self):
+        """Learning cards before reviewing cards"""
+        return [ *self.learning, *self.reviewing ]
+
+
+def get_state_index(deck) -> StateIndex:
+    return get_menu_state(deck)['index']
+
+
+def card_state(card_id, deck=None) -> Optional[CardState]:
+    """The deck is that of the card, by default"""
+    deck = deck or get_card(card_id)['deckName']
+    return get_state_index(deck).state(card_id)
+
+
+def get_new(deck):
     """Get the IDs of all new cards (those that have never been reviewed)
 
     Note, this also includes the empty cards.
     cf. get_emtpy(), is_empty()
 
     """
-    card_ids = invoke('findCards', query=f"deck:{deck} is:new")
-    return card_ids
+    return get_state_index(deck).new
 
 
-def is_new(card_id):
+def is_new(card_id, deck=None):
     """Card is new, aka. unseen, never yet reviewed
 
     """
-
-    card = get_card(card_id)
-    card_ids = get_new(card['deckName'], ts=time.time()//3600)
-    return card_id in card_ids
+    return card_state(card_id, deck) == CardState.NEW
 
 
-def is_learn(card_id):
+def is_learn(card_id, deck=None):
     """Card is in the learning phase still
 
     """
-    card = get_card(card_id)
-    card_ids = get_learning(card['deckName'], ts=time.time()//3600)
-    return card_id in card_ids
+    return card_state(card_id, deck) == CardState.LEARN
 
 
-def is_review(card_id):
+def is_review(card_id, deck=None):
     """Card has graduated to the reviewing phase
 
     """
-    card = get_card(card_id)
-    card_ids = get_reviewing(card['deckName'], ts=time.time()//3600)
-    return card_id in card_ids
+    return card_state(card_id, deck) == CardState.REVIEW
 
 
-@functools.lru_cache(maxsize=10)
-def get_unreviewed(deck, ts=None):
+@cached(ttl=60 * 60, maxsize=10, tags=deck_tags)
+def get_unreviewed(deck):
     """
     If there hasn't been a review today (since midnight), show the count of
     cards due.
@@ -1090,11 +2111,11 @@ def get_unreviewed(deck, ts=None):
 
     logging.debug(f"if {epoch_review=} < {epoch_midnight=} : ...")
     if epoch_review < epoch_midnight :
-        card_ids = get_due(deck, ts=time.time()//3600)
+        card_ids = get_due(deck)
     return card_ids
 
 
-def get_due(deck, ts=None):
+def get_due(deck):
     """"
     A list of all cards (IDs) due (learning cards before reviewing cards).
 
@@ -1107,27 +2128,17 @@ def get_due(deck, ts=None):
     The cards due (`is:due`) are made up of two disjunct sets:
     * learn(ing) cards:  `is:due  is:learn`
     * review(ing) cards: `is:due -is:learn`
-
-    Note, the `ts` param is just for cache invalidation,
-    not for querying cards due before a certain date/time.
     """
 
-    learning_ids  = get_learning(deck, ts)
-    reviewing_ids = get_reviewing(deck, ts)
+    return get_state_index(deck).due
 
-    return [ *learning_ids, *reviewing_ids ]
 
+def get_learning(deck):
+    return get_state_index(deck).learning
 
-@functools.lru_cache(maxsize=10)
-def get_learning(deck, ts=None):
-    learning_ids  = invoke('findCards', query=f"deck:{deck} is:due  is:learn")
-    return learning_ids
 
-
-@functools.lru_cache(maxsize=10)
-def get_reviewing(deck, ts=None):
-    reviewing_ids = invoke('findCards', query=f"deck:{deck} is:due -is:learn")
-    return reviewing_ids
+def get_reviewing(deck):
+    return get_state_index(deck).reviewing
 
 
 # Cards that aren't due within this many days are considered 'mature'
@@ -1135,8 +2146,8 @@ MATURE_INTERVAL = 365
 
 # Mature cards
 # This set does not overlap with get_new() nor get_mid()
-@functools.lru_cache(maxsize=10)
-def get_old(deck, ts=None):
+@cached(ttl=60 * 60, maxsize=10, tags=deck_tags)
+def get_old(deck):
     card_ids = invoke(
         'findCards',
         query=f"deck:{deck} (is:review OR is:learn) prop:ivl>={MATURE_INTERVAL}"
@@ -1155,14 +2166,17 @@ def get_old(deck, ts=None):
 #     return card_ids
 
 
-@functools.lru_cache
-def get_empty(deck, ts=None):
-    card_ids = search_anki('', deck=deck, field='back')
-    return card_ids
+def get_empty(deck):
+    """Cards with a 'front', but an empty 'back', cf. is_empty()"""
+    return get_menu_state(deck)['empty']
 
 
-@functools.lru_cache
-def get_deck_stats(decks=None, *, ts=None):
+@cached(
+    ttl=60,
+    maxsize=10,
+    tags=lambda decks=None: {'deck:*'},
+)
+def get_deck_stats(decks=None):
     decks = decks or get_deck_names()
     response = invoke('getDeckStats', decks=decks)
     stats = {
@@ -1175,6 +2189,148 @@ def get_deck_stats(decks=None, *, ts=None):
     return stats
 
 
+@cached(ttl=60, maxsize=10, tags=deck_tags)
+def get_menu_state(deck):
+    """Everything the menu shows about a deck, fetched in a single round-trip
+
+    Returns a dict with the deck's 'stats' (cf. get_deck_stats()), the IDs of
+    the 'empty' cards, and the 'index' of card states (cf. StateIndex).
+    """
+
+    batch = Batch()
+    stats_i     = batch.add('getDeckStats', decks=[deck])
+    empty_i     = batch.add('findCards', query=anki_query('', deck=deck, field='back'))
+    new_i       = batch.add('findCards', query=f"deck:{deck} is:new")
+    learning_i  = batch.add('findCards', query=f"deck:{deck} is:due  is:learn")
+    reviewing_i = batch.add('findCards', query=f"deck:{deck} is:due -is:learn")
+    results = batch.send()
+
+    stats = {'new': 0, 'learn': 0, 'review': 0}
+    for deck_stats in (results[stats_i] or {}).values():
+        if deck_stats['name'] == deck:
+            stats = {
+                'new'    :deck_stats['new_count'],
+                'learn'  :deck_stats['learn_count'],
+                'review' :deck_stats['review_count'],
+            }
+
+    index = StateIndex(
+        new       = results[new_i]       or [],
+        learning  = results[learning_i]  or [],
+        reviewing = results[reviewing_i] or [],
+    )
+    return {
+        'stats' : stats,
+        'empty' : results[empty_i] or [],
+        'index' : index,
+    }
+
+
+class Snapshot:
+    """The last value of func(*args), as kept warm by the Refresher"""
+
+    def __init__(self, func, args):
+        self.func = func
+        self.args = args
+        self.tags = set(func.tags(*args)) if func.tags else set()
+        self.value = None
+        # When it was last refreshed, and last read (cf. Refresher.get())
+        self.epoch = self.used = time.monotonic()
+        # Invalidated, but not yet refreshed
+        self.dirty = True
+        # After a failed refresh, not before then
+        self.retry = 0
+
+    def update(self):
+        # Cleared before the request, so that an invalidation meanwhile isn't lost
+        self.dirty = False
+        self.value = self.func.refresh(*self.args)
+        self.epoch = time.monotonic()
+
+
+class Refresher:
+    """Keeps what the menu shows up-to-date, in a background thread
+
+    eg get_menu_state(deck) and get_deck_stats(). The menu then reads the last
+    snapshot, rather than waiting on anki-connect before every keypress. Only
+    the first snapshot of something is waited for.
+
+    Each snapshot is refreshed every `interval` secs, and as soon as anything
+    that it depends on changes, cf. invalidate(). One that's older than `fresh`
+    secs, or was invalidated and not yet refreshed, is stale, eg to mark it as
+    such in the menu. Snapshots not read for `idle` secs are dropped.
+    """
+
+    def __init__(self, *, interval=30, fresh=60, idle=10 * 60):
+        self.interval = interval
+        self.fresh = fresh
+        self.idle = idle
+        # (func, args) => Snapshot
+        self.snapshots = {}
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+
+    def get(self, func, *args):
+        """Returns (value, stale) of the last snapshot of func(*args)"""
+
+        key = (func, args)
+        with self.lock:
+            snapshot = self.snapshots.get(key)
+            if not snapshot:
+                snapshot = self.snapshots[key] = Snapshot(func, args)
+        if snapshot.value is None:
+            snapshot.update()
+        if not self.thread:
+            self.thread = threading.Thread(target=self.run, name='refresher', daemon=True)
+            self.thread.start()
+        snapshot.used = time.monotonic()
+        return snapshot.value, self.is_stale(snapshot)
+
+    def stale(self, func, *args):
+        snapshot = self.snapshots.get((func, args))
+        return not snapshot or self.is_stale(snapshot)
+
+    def is_stale(self, snapshot):
+        return snapshot.dirty or time.monotonic() > snapshot.epoch + self.fresh
+
+    def invalidate(self, *tags):
+        """Refresh the snapshots with any of these tags (else all of them)"""
+        tags = set(tags)
+        with self.lock:
+            for snapshot in self.snapshots.values():
+                if not tags or snapshot.tags & tags:
+                    snapshot.dirty = True
+        self.wake.set()
+
+    def run(self):
+        while True:
+            self.wake.wait(timeout=1)
+            self.wake.clear()
+            now = time.monotonic()
+            with self.lock:
+                for key in [ k for k, s in self.snapshots.items() if now > s.used + self.idle ]:
+                    del self.snapshots[key]
+                due = [
+                    s for s in self.snapshots.values()
+                    if now > s.retry and (s.dirty or now > s.epoch + self.interval)
+                ]
+            for snapshot in due:
+                try:
+                    snapshot.update()
+                # Incl. when assert_anki() gives up, eg while Anki restarts
+                except (Exception, SystemExit) as e:
+                    # Keep the last value, which is now stale
+                    logging.warning(f'{snapshot.func.__name__}{snapshot.args}: {e}')
+                    snapshot.dirty = True
+                    snapshot.retry = now + self.interval
+                    continue
+                logging.debug(f'Refreshed {snapshot.func.__name__}{snapshot.args}')
+
+
+refresher = Refresher()
+
+
 def are_due(card_ids):
     """Deprecated. Card is ready to review (either due, or new)
 
@@ -1189,7 +2345,7 @@ def are_due(card_ids):
         return r[0]
 
 
-def is_due(card_id):
+def is_due(card_id, deck=None):
     """Card is ready to review (due)
 
     Does not include new cards.
@@ -1202,9 +2358,7 @@ def is_due(card_id):
     The Anki UI seems consistent with `is:due`, and not with `areDue`
     """
 
-    card = get_card(card_id)
-    card_ids = get_due(card['deckName'], ts=time.time()//3600)
-    return card_id in card_ids
+    return card_state(card_id, deck) in (CardState.LEARN, CardState.REVIEW)
 
 
 def is_empty(card_id):
@@ -1241,105 +2395,863 @@ def search_google(term):
     url=f'https://google.com/search?q={query_term}'
     launch_url(url)
 
-def search_woorden(term, *, url='http://www.woorden.org/woord/'):
-    query_term = parse.quote(term) # For web searches
-    url = url + query_term
+class RateLimit:
+    """A minimum interval (secs) between the requests to any one host
+
+    Thread-safe: each caller reserves the next free slot for its host, and
+    then sleeps until then.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        # host => earliest time of its next request
+        self.next = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        host = parse.urlsplit(url).hostname
+        with self.lock:
+            now = time.monotonic()
+            at = max(now, self.next.get(host, now))
+            self.next[host] = at + self.interval
+        if at > now:
+            time.sleep(at - now)
+
+
+# To be polite to the remote dictionaries, eg when prefetching, cf. Prefill
+rate_limit = RateLimit(.25)
+
+
+def get_page(url, *, provider, lang, term, refresh=False):
+    """Fetch a page (or get it from the page_cache). Returns (status, content)
+
+    404 pages are returned too, since they have spelling suggestions.
+    Returns None on any other error.
+    """
+
+    key = (provider, lang, term)
+    refresh = refresh or options.refresh
+    if page_cache and not refresh and (page := page_cache.get(*key)):
+        logging.info(f'Cached: {url}')
+        return page
     logging.info(url)
-    # TODO factor this out into an on-screen status() func (curses?)
-    clear_line()
-    print( W(C.INFO, f"Fetching: {url} ..." ), end='', flush=True)
 
+    status = 200
+    rate_limit.wait(url)
+    start = metrics.enabled and time.perf_counter()
     try:
-        response = request.urlopen(url)
+        response = request.urlopen(url, timeout=options.timeout)
         content = response.read().decode('utf-8')
+    except HTTPError as response:
+        # Usually these are server-side errors, throttling, timeouts, etc
+        if response.code != 404:
+            logging.warning(response)
+            return
+
+        # NB urllib raises an exception on 404 pages. The content of the 404
+        # page (eg spellchecker suggestions) is in the Error.
+        content = response.read().decode('utf-8')
+        status = response.code
     except (Exception, KeyboardInterrupt) as e:
         logging.info(e)
         return
+    if metrics.enabled:
+        metrics.record('fetch', provider, time.perf_counter() - start, len(content))
 
-    clear_line()
+    if page_cache:
+        page_cache.put(*key, status, content)
+    return status, content
 
-    # Pages in different formats, for testing:
-    # encyclo:     https://www.woorden.org/woord/hangertje
-    # urlencoding: https://www.woorden.org/woord/op zich
-    # none:        https://www.woorden.org/woord/spacen
-    # ?:           https://www.woorden.org/woord/backspacen #
-    # &copy:       http://www.woorden.org/woord/zien
-    # Bron:        http://www.woorden.org/woord/glashelder
-
-    match = re.search(
-        f"(?s)(<h[1-9].*?{term}.*?)(?=&copy|Bron:|<div|</div)",
-        content
-    )
+
+################################################################################
+# Extraction of the parts of (remote) HTML pages, eg the definition
+
+# Declarative extraction rules, per provider, cf. extract()
+# Each part (eg 'definition') is a list of steps, applied in order, to the page:
+#   ('element', start)          the first element whose start tag matches
+#   ('slice', start, to, end)   the text from `start` through `to`, up to `end`
+#   ('remove', start)           remove each element whose start tag matches
+#   ('prepend', pattern)        prepend its group (in [brackets]), if in the page
+#   ('texts', start)            the (plain) text of each element that matches
+# The patterns are regexes. '{term}' is replaced by the (escaped) term.
+EXTRACT = {
+    'woorden': {
+        # Pages in different formats, for testing:
+        # encyclo:     https://www.woorden.org/woord/hangertje
+        # urlencoding: https://www.woorden.org/woord/op zich
+        # none:        https://www.woorden.org/woord/spacen
+        # ?:           https://www.woorden.org/woord/backspacen #
+        # &copy:       http://www.woorden.org/woord/zien
+        # Bron:        http://www.woorden.org/woord/glashelder
+        'definition': [
+            ('slice', r'<h[1-9]', '{term}', r'&copy|Bron:|<div|</div'),
+        ],
+    },
+    'thefreedictionary': {
+        # (Just the first section, ie of the first source dictionary)
+        'definition': [
+            ('element', r'<div id="Definition">'),
+            ('element', r'<section '),
+            # Remove citations, just to keep Anki cards terse
+            ('remove', r'<div class="cprh">'),
+            # Get pronunciation (the IPA version) via Kerneman/Collins (multiple
+            # languages), and prepend it, in [brackets].
+            ('prepend', r' class="pron">(.*?)</span>'),
+        ],
+        # Spellcheck suggestions, on 404 pages, ie CSS selector: .suggestions a
+        'suggestions': [
+            ('element', r'<\w+\s[^>]*class="(?:[^"]*\s)?suggestions[\s"]'),
+            ('texts', r'<a\b'),
+        ],
+    },
+}
+
+
+@cached(maxsize=1000)
+def compiled(pattern, flags=0):
+    """Compiled once, since the lookups in the regex module's own cache are slow"""
+    return re.compile(pattern, flags)
+
+
+def tag_re(name):
+    """The start/end tags of elements with this name, cf. element()"""
+    return compiled(f'<(/?){name}\\b[^>]*?(/?)>', re.IGNORECASE)
+
+
+def element(content, start, pos=0):
+    """The span of the first element whose start tag matches the regex `start`
+
+    From its start tag, through its matching end tag. Rather than parsing the
+    whole page into a tree, only the tags of this same name are scanned.
+    Returns (begin, end), or None.
+    """
+
+    match = compiled(start).search(content, pos)
     if not match:
-        logging.info(term + ": No match in HTML document")
         return
-    definition = match.group()
-    return definition
+    name = compiled(r'<([a-zA-Z][\w-]*)').match(content, match.start())
+    if not name:
+        return
+    depth = 0
+    for tag in tag_re(name.group(1)).finditer(content, match.start()):
+        closing, self_closing = tag.groups()
+        if closing:
+            depth -= 1
+        elif not self_closing:
+            depth += 1
+        if depth == 0:
+            return match.start(), tag.end()
+    # Never closed
+    return match.start(), len(content)
 
 
-def search_thefreedictionary(term, *, lang):
-    return_obj = {}
-    if not term or '*' in term:
-        return
-    query_term = parse.quote(term) # For web searches
-    url = f'https://{lang}.thefreedictionary.com/{query_term}'
-    logging.info(url)
+def inner_text(html_str):
+    """The plain text of some HTML, eg of an element, like bs4's .text"""
+    return html.unescape(compiled(r'<[^>]*>').sub('', html_str))
 
-    # TODO factor this out into status() func or something (curses?)
-    clear_line()
-    print(W(C.INFO, f"Fetching: {url} ..."), end='', flush=True)
 
-    try:
-        response = request.urlopen(url)
-        content = response.read().decode('utf-8')
-    except HTTPError as response:
-        # Usually these are server-side errors, throttling, timeouts, etc
-        if response.code != 404:
-            logging.warning(response)
+def extract(content, rules, *, term='', parts=None):
+    """Extract the parts (eg 'definition') of a page, by its rules, cf. EXTRACT
+
+    Returns a dict of the parts found. Only the given parts, if any.
+    """
+
+    obj = {}
+    for part, steps in rules.items():
+        if parts and part not in parts:
+            continue
+        text = content
+        for step, *patterns in steps:
+            patterns = [ p.replace('{term}', re.escape(term)) for p in patterns ]
+            if step == 'element':
+                span = element(text, *patterns)
+                text = span and text[span[0]:span[1]]
+            elif step == 'slice':
+                start, to, end = patterns
+                text = (
+                    (begin := compiled(start).search(text))
+                    and (through := compiled(to).search(text, begin.start()))
+                    and (until := compiled(end).search(text, through.end()))
+                    and text[begin.start():until.start()]
+                )
+            elif step == 'remove':
+                pos = 0
+                while span := element(text, *patterns, pos):
+                    text = text[:span[0]] + text[span[1]:]
+                    pos = span[0]
+            elif step == 'prepend':
+                if match := compiled(*patterns).search(content):
+                    text = '\n'.join([ '[' + match.group(1) + ']', text ])
+            elif step == 'texts':
+                texts = []
+                pos = 0
+                while span := element(text, *patterns, pos):
+                    texts.append(inner_text(text[span[0]:span[1]]))
+                    pos = span[1]
+                text = texts
+            if not text:
+                break
+        if text:
+            obj[part] = text
+    return obj
+
+
+def parse_woorden(content, term):
+    """Extract the definition of term from a woorden.org HTML page"""
+
+    obj = extract(content, EXTRACT['woorden'], term=term)
+    if not obj:
+        logging.info(term + ": No match in HTML document")
+    return obj.get('definition')
+
+
+def parse_thefreedictionary(content, *, status=200):
+    """Extract the definition (or spelling suggestions, if 404) from a page
+
+    Returns a dict with a 'definition' and/or 'suggestions'.
+    """
+
+    parts = ('definition', 'suggestions') if status == 404 else ('definition',)
+    obj = extract(content, EXTRACT['thefreedictionary'], parts=parts)
+    if status == 404:
+        obj['suggestions'] = sorted(obj.get('suggestions', []), key=str.casefold)
+    return obj
+
+
+class Provider:
+    """A remote dictionary: where to fetch a term (via get_url()), how to parse it
+
+    `parse(content, term=, status=)` returns a dict with a 'definition' and/or
+    'suggestions'. Latency and failures are tracked per provider, cf.
+    provider_report(). Providers are registered by name in PROVIDERS, and
+    configured per deck in DECK_PROVIDERS.
+    """
+
+    def __init__(self, name, *, url, parse):
+        self.name = name
+        # The key of its URL in get_url()
+        self.url = url
+        self.parse = parse
+        self.calls = self.failures = 0
+        # Seconds, of the most recent calls
+        self.latencies = collections.deque(maxlen=100)
+        self.lock = threading.Lock()
+
+    def search(self, term, *, lang, refresh=False):
+        url = get_url(term, lang=lang).get(self.url)
+        if not url:
+            return
+        start = time.monotonic()
+        obj = None
+        try:
+            page = get_page(url, provider=self.name, lang=lang, term=term, refresh=refresh)
+            if page:
+                status, content = page
+                obj = self.parse(content, term=term, status=status)
+        except Exception as e:
+            logging.warning(f'{self.name}: {e}')
+        with self.lock:
+            self.calls += 1
+            self.failures += not obj
+            self.latencies.append(time.monotonic() - start)
+        return obj
+
+    def stats(self):
+        with self.lock:
+            latencies = sorted(self.latencies)
+        return {
+            'calls'    : self.calls,
+            'failures' : self.failures,
+            'p50'      : latencies and latencies[len(latencies) // 2],
+            'max'      : latencies and latencies[-1],
+        }
+
+
+PROVIDERS = {}
+
+
+def register(provider):
+    PROVIDERS[provider.name] = provider
+
+
+register(Provider(
+    'woorden',
+    url='woorden',
+    parse=lambda content, *, term, status: { 'definition': parse_woorden(content, term) },
+))
+register(Provider(
+    'thefreedictionary',
+    url='freedictionary',
+    parse=lambda content, *, term, status: parse_thefreedictionary(content, status=status),
+))
+
+# The providers of each deck (ie language), else the default
+# Several are looked up concurrently, and their definitions merged.
+DECK_PROVIDERS = {
+    'nl': [ 'woorden' ],
+    None: [ 'thefreedictionary' ],
+}
+
+
+def deck_providers(deck):
+    """The providers to look up terms of this deck, cf. --providers"""
+    names = (
+        (options.providers and options.providers.split(','))
+        or DECK_PROVIDERS.get(deck)
+        or DECK_PROVIDERS[None]
+    )
+    return [ PROVIDERS[name] for name in names if name in PROVIDERS ]
+
+
+def provider_report():
+    """One line of latency/failure stats per provider used, eg for logging"""
+    lines = []
+    for name, provider in sorted(PROVIDERS.items()):
+        stats = provider.stats()
+        if not stats['calls']:
+            continue
+        lines += [ ''
+            + f"{name:20s} "
+            + f"calls:{stats['calls']:6d} "
+            + f"failures:{stats['failures']:6d} "
+            + f"p50:{stats['p50'] * 1000:7.0f}ms "
+            + f"max:{stats['max'] * 1000:7.0f}ms"
+        ]
+    return '\n'.join(lines)
+
+
+atexit.register(lambda: logging.info('Provider stats:\n' + provider_report()))
+
+
+class CardStore:
+    """In-memory store of cards, loaded in bulk via `cardsInfo`
+
+    Rather than one request per card, cards are fetched in chunks: either
+    explicitly via prefetch(), or, on a miss, the chunk of the current result
+    set (cf. expect()) starting at the missing card. So, paging through a result
+    set with N/P only makes one request per CHUNK cards.
+
+    Entries stay valid until invalidated, ie when a card is changed, via its
+    tags 'card:<card_id>' and 'note:<note_id>', cf. changed().
+    Cards that don't exist (anymore), or aren't 'Basic', are stored as None.
+    """
+
+    CHUNK = 50
+
+    def __init__(self, maxsize=10_000):
+        self.cache = Cache('cards', maxsize=maxsize)
+        # The current result set (ordered), and the position of each card in it
+        self.expected = []
+        self.position = {}
+
+    def __contains__(self, card_id):
+        return card_id in self.cache
+
+    def expect(self, card_ids):
+        """Register the result set that's about to be paged through"""
+        self.expected = list(card_ids)
+        self.position = { card_id: i for i, card_id in enumerate(self.expected) }
+
+    def prefetch(self, card_ids):
+        """Load all of these cards that aren't loaded yet, in one round-trip"""
+
+        missing = list(dict.fromkeys(
+            card_id for card_id in card_ids if card_id not in self.cache
+        ))
+        for card_id, card in cards_info(missing, chunk=self.CHUNK).items():
+            self.put(card_id, card)
+
+    def put(self, card_id, card):
+        tags = { f'card:{card_id}' }
+        if card:
+            tags.add(f"note:{card['note']}")
+        if card and card['modelName'] != 'Basic':
+            logging.debug(f"Model/Note type:" + card['modelName'])
+            card = None
+        self.cache.put(card_id, card, tags=tags)
+
+    def get(self, card_id):
+        hit, card = self.cache.lookup(card_id)
+        if hit:
+            return card
+        if card_id in self.position:
+            i = self.position[card_id]
+            self.prefetch(self.expected[i:i+self.CHUNK])
+        else:
+            self.prefetch([card_id])
+        hit, card = self.cache.lookup(card_id, count=False)
+        return card
+
+
+card_store = CardStore()
+
+
+def cards_info(card_ids, *, chunk=50, chunks_per_request=20) -> dict:
+    """`cardsInfo` of many cards, in chunks, batched into few round-trips
+
+    Returns a dict by card ID. Cards that don't exist (anymore) map to None.
+    Cards of a chunk that failed are left out (so that they can be retried).
+    """
+
+    chunks = [ card_ids[i:i+chunk] for i in range(0, len(card_ids), chunk) ]
+    infos = {}
+    for i in range(0, len(chunks), chunks_per_request):
+        requested = chunks[i:i+chunks_per_request]
+        if len(requested) == 1:
+            results = [ invoke('cardsInfo', cards=requested[0]) ]
+        else:
+            batch = Batch()
+            for ids in requested:
+                batch.add('cardsInfo', cards=ids)
+            results = batch.send()
+        for ids, result in zip(requested, results):
+            if result is None:
+                continue
+            found = { info['cardId']: info for info in result if info }
+            infos.update({ card_id: found.get(card_id) for card_id in ids })
+    return infos
+
+
+def get_card(id):
+    """Only works for cards with note type 'Basic' (with fields 'Front', 'Back')
+
+    cf. CardStore
+    """
+
+    return card_store.get(id)
+
+
+class Mirror:
+    """A local (SQLite) mirror of the cards of each deck, for faster searches
+
+    Stores the Front/Back fields, the (sub-)deck and the modification time of
+    each ('Basic') card. Searches, autocompletion and wildcard counts then don't
+    need to go through anki-connect. cf. search_anki(), completer()
+
+    And, for nl, an index of the inflected forms listed on the back of each
+    card, cf. card_inflections()
+
+    A deck is mirrored completely on its first search. After that, it's updated
+    incrementally, from the notes edited since (via `edited:N`) and by removing
+    the cards that no longer exist. Changes made by this CLI are applied
+    directly (or, for new cards, mark the deck as stale).
+    """
+
+    # Seconds after which a deck is refreshed (incrementally) on the next search
+    TTL = 60
+
+    # Bumped on any change to SCHEMA, to rebuild the mirror from scratch
+    VERSION = 3
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cards (
+            card_id      INTEGER PRIMARY KEY,
+            note_id      INTEGER,
+            deck         TEXT,
+            sub_deck     TEXT,
+            front        TEXT,
+            back         TEXT,
+            front_folded TEXT,
+            back_folded  TEXT,
+            front_ascii  TEXT,
+            mod          INTEGER,
+            front_key    TEXT
+        );
+        CREATE INDEX IF NOT EXISTS cards_deck_front ON cards (deck, front_folded);
+        CREATE INDEX IF NOT EXISTS cards_deck_key ON cards (deck, front_key);
+        CREATE TABLE IF NOT EXISTS inflections (
+            form    TEXT,
+            deck    TEXT,
+            card_id INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS inflections_deck_form ON inflections (deck, form);
+        CREATE INDEX IF NOT EXISTS inflections_card ON inflections (card_id);
+        CREATE TABLE IF NOT EXISTS decks (
+            deck      TEXT PRIMARY KEY,
+            refreshed REAL
+        );
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        if self.db.execute('PRAGMA user_version').fetchone()[0] != self.VERSION:
+            # It's only a mirror, so it's simply mirrored again
+            self.db.executescript(
+                'DROP TABLE IF EXISTS cards; DROP TABLE IF EXISTS decks; '
+                'DROP TABLE IF EXISTS inflections;'
+            )
+            self.db.execute(f'PRAGMA user_version = {self.VERSION}')
+        self.db.executescript(self.SCHEMA)
+        self.lock = threading.RLock()
+        # Decks to refresh on the next search, regardless of the TTL
+        self.stale = set()
+        # Incremented on every change, eg to know when to rebuild an index
+        self.version = 0
+
+    def refreshed(self, deck) -> Optional[float]:
+        row = self.db.execute(
+            'SELECT refreshed FROM decks WHERE deck = ?', (deck,)
+        ).fetchone()
+        return row and row[0]
+
+    def touch(self, deck=None):
+        """Mark the deck (default: all decks) to be refreshed on next use"""
+        with self.lock:
+            decks = [deck] if deck else [
+                row[0] for row in self.db.execute('SELECT deck FROM decks')
+            ]
+            self.stale.update(decks)
+
+    def refresh(self, deck, *, full=False) -> bool:
+        """Update the mirror of this deck from Anki. Returns False on failure"""
+
+        with self.lock:
+            refreshed = None if full else self.refreshed(deck)
+            start = time.time()
+            batch = Batch()
+            all_i = batch.add('findCards', query=f'deck:{deck}')
+            if refreshed:
+                # Whole days, with a day extra, since Anki counts from its day
+                # cutoff (not from now)
+                days = 1 + math.ceil((start - refreshed) / (24 * 60 * 60))
+                edited_i = batch.add('findCards', query=f'deck:{deck} edited:{days}')
+            results = batch.send()
+            if results[all_i] is None:
+                return False
+
+            all_ids = set(results[all_i])
+            known = { row[0] for row in self.db.execute(
+                'SELECT card_id FROM cards WHERE deck = ?', (deck,)
+            ) }
+            if refreshed:
+                fetch = (set(results[edited_i] or []) | (all_ids - known))
+            else:
+                logging.info(f'Mirroring deck {deck} ({len(all_ids)} cards) ...')
+                fetch = all_ids
+            deleted = known - all_ids
+
+            infos = cards_info(sorted(fetch))
+            rows = [
+                self._row(deck, card) for card in infos.values()
+                if card and card['modelName'] == 'Basic'
+            ]
+            # Cards that aren't Basic (anymore) are treated as deleted
+            deleted |= { card_id for card_id, card in infos.items()
+                if not card or card['modelName'] != 'Basic' }
+            with self.db:
+                self.db.executemany(
+                    'DELETE FROM cards WHERE card_id = ?', [(i,) for i in deleted]
+                )
+                self.db.executemany(
+                    'INSERT OR REPLACE INTO cards VALUES (?,?,?,?,?,?,?,?,?,?,?)',
+                    rows
+                )
+                self.db.executemany(
+                    'DELETE FROM inflections WHERE card_id = ?',
+                    [(i,) for i in deleted | set(infos)]
+                )
+                self.db.executemany(
+                    'INSERT INTO inflections VALUES (?,?,?)',
+                    [ inflection for row in rows for inflection in self._inflections(*row[:6]) ]
+                )
+                self.db.execute(
+                    'INSERT OR REPLACE INTO decks VALUES (?, ?)', (deck, start)
+                )
+            self.stale.discard(deck)
+            if rows or deleted:
+                self.version += 1
+
+            # Edited elsewhere, so the cached cards are stale too
+            if refreshed and fetch:
+                invalidate(*[ f'card:{card_id}' for card_id in fetch ])
+            logging.info(
+                f'Mirror {deck}: {len(rows)} updated, {len(deleted)} deleted, '
+                f'in {time.time() - start:.2f}s'
+            )
+            return True
+
+    def _row(self, deck, card):
+        front = card['fields']['Front']['value']
+        back = card['fields']['Back']['value']
+        return (
+            card['cardId'],
+            card['note'],
+            deck,
+            card['deckName'],
+            front,
+            back,
+            front.casefold(),
+            back.casefold(),
+            fold(front),
+            card.get('mod'),
+            squeeze(front.casefold()),
+        )
+
+    @staticmethod
+    def _inflections(card_id, note_id, deck, sub_deck, front, back):
+        """Rows of the inflections table, for a row of the cards table"""
+        if deck != 'nl':
+            return []
+        try:
+            forms = card_inflections(front, back)
+        except Exception as e:
+            # Rather than failing the refresh of the whole deck
+            logging.warning(f'{card_id} {front}: {e}')
+            return []
+        return [ (form, deck, card_id) for form in forms ]
+
+    def ready(self, deck) -> bool:
+        """Whether this deck is mirrored (and refreshed if necessary)"""
+
+        with self.lock:
+            refreshed = self.refreshed(deck)
+            if refreshed and deck not in self.stale and time.time() < refreshed + self.TTL:
+                return True
+            if not refreshed:
+                status(f'Mirroring deck {deck} ...')
+            # If the refresh fails, an outdated mirror is still better than none
+            return self.refresh(deck) or bool(refreshed)
+
+    def update(self, card_id, *, front=None, back=None):
+        """Apply an edit made by this CLI"""
+        with self.lock, self.db:
+            self.version += 1
+            if front:
+                self.db.execute(
+                    'UPDATE cards SET front = ?, front_folded = ?, front_ascii = ?, front_key = ? '
+                    'WHERE card_id = ?',
+                    (front, front.casefold(), fold(front), squeeze(front.casefold()), card_id)
+                )
+            if back:
+                self.db.execute(
+                    'UPDATE cards SET back = ?, back_folded = ? WHERE card_id = ?',
+                    (back, back.casefold(), card_id)
+                )
+            # Re-index, since the (placeholders of) inflections use the front
+            row = self.db.execute(
+                'SELECT card_id, note_id, deck, sub_deck, front, back FROM cards WHERE card_id = ?',
+                (card_id,)
+            ).fetchone()
+            self.db.execute('DELETE FROM inflections WHERE card_id = ?', (card_id,))
+            if row:
+                self.db.executemany(
+                    'INSERT INTO inflections VALUES (?,?,?)', self._inflections(*row)
+                )
+
+    def delete(self, card_id):
+        with self.lock, self.db:
+            self.version += 1
+            self.db.execute('DELETE FROM cards WHERE card_id = ?', (card_id,))
+            self.db.execute('DELETE FROM inflections WHERE card_id = ?', (card_id,))
+
+    @staticmethod
+    def like(pattern):
+        """Map Anki's wildcards to those of SQL LIKE (with escape char '\\')
+
+        Anki's `_` (any single char) is the same in LIKE.
+        """
+        pattern = pattern.casefold()
+        pattern = re.sub(r'([%\\])', r'\\\1', pattern)
+        return pattern.replace('*', '%')
+
+    def search(self, query, *, deck, wild=False, field='front'):
+        """Same semantics as search_anki(), or None if not available
+
+        cf. anki_query()
+        """
+
+        columns = {
+            'front' : ['front_folded'],
+            'back'  : ['back_folded'],
+            # Unqualified search terms match anywhere, in any field
+            None    : ['front_folded', 'back_folded'],
+        }.get(field)
+        if not columns or not self.ready(deck):
+            return
+
+        if field == 'front' and not wild and deck == 'nl' and not re.search(r'[*_ ]', query):
+            # A literal query: one (indexed) lookup by key, however many
+            # variants, just filtering out the other ones with the same key
+            matches = variants_re(query, deck=deck).fullmatch
+            with self.lock:
+                rows = self.db.execute(
+                    'SELECT card_id, front_folded FROM cards WHERE deck = ? AND front_key = ? ORDER BY card_id',
+                    (deck, squeeze(query.casefold()))
+                ).fetchall()
+            return [ card_id for card_id, front in rows if matches(front) ]
+
+        terms = search_variants(query, deck=deck)
+        if wild or not field:
+            terms = [ f'*{term}*' for term in terms ]
+
+        where = ' OR '.join(
+            f"{column} LIKE ? ESCAPE '\\'" for term in terms for column in columns
+        )
+        params = [ self.like(term) for term in terms for column in columns ]
+        with self.lock:
+            rows = self.db.execute(
+                f'SELECT card_id FROM cards WHERE deck = ? AND ({where}) ORDER BY card_id',
+                [deck, *params]
+            ).fetchall()
+        return [ row[0] for row in rows ]
+
+    def search_combined(self, query, *, deck):
+        """Same semantics as search_combined(), or None if not available
+
+        In one scan, since each exact match is also a wildcard match.
+        """
+
+        if not self.ready(deck):
+            return
+        terms = search_variants(query, deck=deck)
+        columns = ['front_folded', 'back_folded']
+        where = ' OR '.join(
+            f"{column} LIKE ? ESCAPE '\\'" for term in terms for column in columns
+        )
+        params = [ self.like(f'*{term}*') for term in terms for column in columns ]
+        with self.lock:
+            rows = self.db.execute(
+                f'SELECT card_id, front_folded FROM cards WHERE deck = ? AND ({where}) ORDER BY card_id',
+                [deck, *params]
+            ).fetchall()
+        # Any of the variants, exactly
+        matches = variants_re(query, deck=deck).fullmatch
+        card_ids = [ card_id for card_id, front in rows if matches(front) ]
+        # Else, by an inflected form, which is then also a wildcard match
+        card_ids = card_ids or self.inflected(query, deck=deck)
+        return card_ids, len({ row[0] for row in rows } - set(card_ids))
+
+    def inflected(self, query, *, deck):
+        """The cards listing this query as one of their inflected forms
+
+        eg 'bestekken' => the card of 'bestek'. cf. card_inflections()
+        """
+
+        if not self.ready(deck):
+            return []
+        with self.lock:
+            rows = self.db.execute(
+                'SELECT DISTINCT card_id FROM inflections WHERE deck = ? AND form = ? ORDER BY card_id',
+                (deck, re.sub(r'\s+', ' ', query).strip().casefold())
+            ).fetchall()
+        return [ row[0] for row in rows ]
+
+    def fronts(self, deck):
+        """All the fronts of the cards in this deck, or None if not available"""
+
+        if not self.ready(deck):
             return
+        with self.lock:
+            rows = self.db.execute(
+                'SELECT front FROM cards WHERE deck = ?', (deck,)
+            ).fetchall()
+        return [ row[0] for row in rows ]
 
-        # NB urllib raises an exception on 404 pages. The content of the 404
-        # page (eg spellchecker suggestions) is in the Error.
-        content = response.read().decode('utf-8')
-        # Parse out spellcheck suggestions via CSS selector: .suggestions a
-        soup = bs4.BeautifulSoup(content, 'html.parser')
-        suggestions = [ r.text for r in soup.select('.suggestions a') ]
-        return_obj['suggestions'] = sorted(suggestions, key=str.casefold)
-    except (Exception, KeyboardInterrupt) as e:
-        logging.info(e)
-        return
 
-    clear_line()
-    match = re.search('<div id="Definition"><section .*?>.*?</section>', content)
-    if not match:
-        return return_obj
+# cf. the --mirror option
+mirror = None
 
-    definition = match.group()
-    # Remove citations, just to keep Anki cards terse
-    definition = re.sub('<div class="cprh">.*?</div>', '', definition)
 
-    # Get pronunciation (the IPA version) via Kerneman/Collins (multiple
-    # languages), and prepend it, in [brackets].
-    match = re.search(' class="pron">(.*?)</span>', content)
-    if match:
-        ipa_str = '[' + match.group(1) + ']'
-        definition = "\n".join([ipa_str, definition])
-    return_obj['definition'] = definition
-    return return_obj
+class PageCache:
+    """An on-disk (SQLite) cache of the pages fetched from remote dictionaries
 
+    Keyed by (provider, lang, term). Pages are stored compressed, and expire
+    after TTL seconds. When the total (compressed) size exceeds `maxsize`
+    bytes, the least recently used pages are evicted.
 
-@functools.lru_cache(maxsize=100)
-def get_card(id):
-    """Only works for cards with note type 'Basic' (with fields 'Front', 'Back')
+    404 pages are cached too, since they have the spelling suggestions.
+    Other errors aren't. cf. get_page()
     """
 
-    cardsInfo = invoke('cardsInfo', cards=[id])
-    if not cardsInfo: return
-    card = cardsInfo[0]
-    logging.debug(f"Model/Note type:" + card['modelName'])
-    if card['modelName'] != 'Basic' :
-        return
-    return card
+    TTL = 30 * 24 * 3600
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            provider TEXT,
+            lang     TEXT,
+            term     TEXT,
+            status   INTEGER,
+            content  BLOB,
+            size     INTEGER,
+            fetched  REAL,
+            accessed REAL,
+            PRIMARY KEY (provider, lang, term)
+        );
+        CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed);
+    """
+
+    def __init__(self, path, *, ttl=TTL, maxsize=50_000_000):
+        self.path = path
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Fetches run in a background thread, cf. Fetch
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(self.SCHEMA)
+        self.lock = threading.RLock()
+        self.hits = self.misses = self.evicted = 0
+
+    def get(self, provider, lang, term):
+        """Returns the (status, content) of the page, or None if not cached"""
+
+        key = (provider, lang, term)
+        with self.lock:
+            row = self.db.execute(
+                'SELECT status, content FROM pages '
+                'WHERE provider = ? AND lang = ? AND term = ? AND fetched > ?',
+                [*key, time.time() - self.ttl]
+            ).fetchone()
+            if not row:
+                self.misses += 1
+                return
+            self.hits += 1
+            with self.db:
+                self.db.execute(
+                    'UPDATE pages SET accessed = ? '
+                    'WHERE provider = ? AND lang = ? AND term = ?',
+                    [time.time(), *key]
+                )
+        status, content = row
+        return status, zlib.decompress(content).decode('utf-8')
+
+    def put(self, provider, lang, term, status, content):
+        compressed = zlib.compress(content.encode('utf-8'))
+        now = time.time()
+        with self.lock, self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                [provider, lang, term, status, compressed, len(compressed), now, now]
+            )
+            self.evict()
+
+    def evict(self):
+        """Drop the least recently used pages, until within maxsize"""
+
+        total, = self.db.execute('SELECT TOTAL(size) FROM pages').fetchone()
+        if total <= self.maxsize:
+            return
+        rows = self.db.execute(
+            'SELECT rowid, size FROM pages ORDER BY accessed'
+        ).fetchall()
+        drop = []
+        for rowid, size in rows:
+            if total <= self.maxsize:
+                break
+            drop.append((rowid,))
+            total -= size
+        self.db.executemany('DELETE FROM pages WHERE rowid = ?', drop)
+        self.evicted += len(drop)
+
+    def stats(self):
+        with self.lock:
+            pages, size = self.db.execute(
+                'SELECT COUNT(*), TOTAL(size) FROM pages'
+            ).fetchone()
+        return f'pages:{pages} bytes:{size:.0f} hits:{self.hits} misses:{self.misses} evicted:{self.evicted}'
+
+
+# cf. the --refresh option
+page_cache = None
 
 
 def add_card(term, definition=None, *, deck):
@@ -1347,8 +3259,6 @@ def add_card(term, definition=None, *, deck):
 
     (If you want the card_id, do another search for it)
     """
-    get_new.cache_clear()
-    get_empty.cache_clear()
     note = {
         'deckName': deck,
         'modelName': 'Basic',
@@ -1363,7 +3273,10 @@ def add_card(term, definition=None, *, deck):
     definition = normalizer(definition, term=term)
     note['fields']['Back'] = definition
     # NB, duplicate check (at deck scope) enabled by default
-    note_id = invoke('addNote', note=note)
+    id = journal.add('addNote', note=note, changed={'deck': deck})
+    note_id = (journal.flush() or {}).get(id)
+    if mirror:
+        mirror.touch(deck)
 
     # Alternatively, use the Anki GUI to add a new card
     #     # NB, this card_id won't exist if the user aborts the dialog.
@@ -1371,22 +3284,253 @@ def add_card(term, definition=None, *, deck):
     #     note_id = invoke('guiAddCards', note=note)
 
 
+class Journal:
+    """A durable log of the changes to send to anki-connect, sent in batches
+
+    ie answers to reviews, and notes added, updated or deleted. Each change is
+    appended to the (JSON Lines) file, and synced to disk, before it's sent,
+    and marked as done once it was. So, if Anki is (re)starting, nothing is
+    lost: what wasn't sent yet is retried, and, after a crash, replayed on the
+    next startup, cf. replay(). (Without a path, it's only kept in memory.)
+
+    Answers are sent by a background thread, in one `multi` request per batch:
+    once `batch` changes are queued, or `linger` secs after the first one, or
+    on flush(), eg before a sync, or on exit. Other changes are flushed right
+    away by their callers, which need the result, eg add_card().
+
+    Sending a change again is harmless: an answer is skipped if the card was
+    already reviewed since, and a note that was already added is rejected as a
+    duplicate. Updates (of fields) and deletes are idempotent anyway.
+    """
+
+    def __init__(self, path=None, *, batch=10, linger=2):
+        self.path = path
+        self.batch = batch
+        self.linger = linger
+        # The changes not yet sent (in order): dicts with an 'id', 'time'
+        # (epoch ms), 'action', 'params', and what it 'changed', cf. changed()
+        self.queue = []
+        self.seq = 0
+        self.cond = threading.Condition()
+        # So that only one request is sent at a time, in order
+        self.sending = threading.Lock()
+        self.thread = None
+        self.file = None
+        # Counts the requests sent, eg to redraw the menu after one
+        self.version = 0
+        # Whether the last request failed, ie anki-connect can't be reached
+        self.failing = False
+        if path:
+            self.load()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def load(self):
+        """The changes in the file that weren't marked as done"""
+        entries = {}
+        if os.path.exists(self.path):
+            with open(self.path) as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Eg the last line, if the write was interrupted
+                        continue
+                    if 'done' in entry:
+                        entries.pop(entry['done'], None)
+                    else:
+                        # Sent before (maybe), cf. replay()
+                        entry['tried'] = True
+                        entries[entry['id']] = entry
+        self.queue = list(entries.values())
+        self.seq = max(entries, default=0)
+        self.file = open(self.path, 'a')
+        self.compact()
+
+    def write(self, *records):
+        if not self.file:
+            return
+        for record in records:
+            self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def compact(self):
+        """Rewrite the file with just the changes not yet done"""
+        if not self.file:
+            return
+        with self.cond:
+            self.file.close()
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path) or '.')
+            with os.fdopen(fd, 'w') as file:
+                for entry in self.queue:
+                    file.write(json.dumps({ k: v for k, v in entry.items() if k != 'tried' }) + '\n')
+            os.replace(tmp, self.path)
+            self.file = open(self.path, 'a')
+
+    def add(self, action, *, changed=None, **params) -> int:
+        """Journal a change, to be sent. Returns its ID, cf. flush()"""
+        with self.cond:
+            self.seq += 1
+            entry = {
+                'id'      : self.seq,
+                'time'    : int(time.time() * 1000),
+                'action'  : action,
+                'params'  : params,
+                'changed' : changed or {},
+            }
+            self.write(entry)
+            self.queue.append(entry)
+            self.cond.notify()
+        self.start()
+        return entry['id']
+
+    def start(self):
+        with self.cond:
+            if not self.thread:
+                self.thread = threading.Thread(target=self.run, name='journal', daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.queue:
+                    self.cond.wait()
+                first = time.monotonic()
+                while (len(self.queue) < self.batch
+                    and (left := first + self.linger - time.monotonic()) > 0
+                ):
+                    self.cond.wait(left)
+            if self.flush() is None:
+                time.sleep(self.linger)
+
+    def replay(self):
+        """Send what wasn't done (in a previous session). Returns its count"""
+        n = len(self.queue)
+        if n:
+            logging.info(f'Replaying {n} changes')
+            if self.flush() is None:
+                # Retry in the background
+                self.start()
+        return n
+
+    def reviewed(self, entries):
+        """The IDs of answers whose card was already reviewed since"""
+        answered = {
+            answer['cardId']: entry for entry in entries
+            if entry['action'] == 'answerCards' for answer in entry['params']['answers']
+        }
+        if not answered:
+            return set()
+        reviews = self.request([{
+            'action': 'getReviewsOfCards', 'params': { 'cards': list(answered) },
+        }])
+        reviews = reviews and reviews[0].get('result') or {}
+        return {
+            answered[int(card_id)]['id'] for card_id, card_reviews in reviews.items()
+            if any(review['id'] >= answered[int(card_id)]['time'] for review in card_reviews)
+        }
+
+    def request(self, actions):
+        """One `multi` request. None if anki-connect can't be reached
+
+        (Unlike invoke(), this doesn't launch Anki, nor exit if it can't.)
+        """
+        body = json.dumps({ 'action': 'multi', 'params': { 'actions': actions }, 'version': 6 })
+        try:
+            start = metrics.enabled and time.perf_counter()
+            content = anki_pool.request(body.encode('utf-8'))
+            if metrics.enabled:
+                metrics.record('invoke', 'multi:journal', time.perf_counter() - start, len(body) + len(content))
+            return json.loads(content)['result']
+        except (OSError, http.client.HTTPException, ValueError, KeyError) as e:
+            logging.warning(f'Journal: {e}')
+            anki_pool.clear()
+
+    def flush(self) -> Optional[dict]:
+        """Send whatever is queued now. Returns the results by ID
+
+        Or None if anki-connect can't be reached. (Then it's all still queued.)
+        """
+
+        with self.sending:
+            with self.cond:
+                entries = list(self.queue)
+            if not entries:
+                return {}
+
+            # Those that might have been sent already, but not marked as done
+            skip = self.reviewed([ e for e in entries if e.get('tried') ])
+
+            # Consecutive answers are merged into one action
+            actions = []
+            sent = []
+            for entry in entries:
+                if entry['id'] in skip:
+                    continue
+                if (entry['action'] == 'answerCards' and actions
+                    and actions[-1]['action'] == 'answerCards'
+                ):
+                    actions[-1]['params']['answers'] += entry['params']['answers']
+                    sent[-1].append(entry)
+                    continue
+                actions.append({
+                    'action': entry['action'],
+                    'params': copy.deepcopy(entry['params']),
+                    'version': 6,
+                })
+                sent.append([ entry ])
+
+            responses = actions and self.request(actions)
+            self.failing = responses is None
+            if responses is None:
+                for entry in entries:
+                    entry['tried'] = True
+                return None
+
+            results = {}
+            for group, response in zip(sent, responses or []):
+                error = response.get('error')
+                if error is not None:
+                    # Eg a duplicate note. Retrying wouldn't help
+                    logging.error(f"{group[0]['action']}: {error}")
+                for entry in group:
+                    results[entry['id']] = response.get('result')
+            with self.cond:
+                done = { entry['id'] for entry in entries }
+                self.queue = [ e for e in self.queue if e['id'] not in done ]
+                self.write(*[ { 'done': id } for id in sorted(done) ])
+                empty = not self.queue
+            if empty:
+                self.compact()
+            logging.info(f'Sent {len(entries)} changes, skipped {len(skip)}')
+            for entry in entries:
+                changed(**entry['changed'])
+            self.version += 1
+            return results
+
+
+# cf. the journal file in __main__
+journal = Journal()
+atexit.register(lambda: journal.flush())
+
+
 def answer_card(card_id, ease: int):
     """Review this card and set ease. 1: Again/New, 2: Hard, 3: Good, 4: Easy
+
+    The answer is sent in the background, cf. Journal
     """
-    # Note, functools.lru_cache doesn't allow removing single items
-    get_card.cache_clear()
-    get_new.cache_clear()
-    get_learning.cache_clear()
-    get_reviewing.cache_clear()
-    get_unreviewed.cache_clear()
-    get_deck_stats.cache_clear()
-    invoke('answerCards', answers=[{'cardId': card_id, 'ease': ease}])
+    card = get_card(card_id)
+    journal.add(
+        'answerCards',
+        answers=[{'cardId': card_id, 'ease': ease}],
+        changed={'card_id': card_id, 'deck': card and card['deckName']},
+    )
 
 
 def update_card(card_id, *, front=None, back=None):
-    get_card.cache_clear()
-    get_empty.cache_clear()
+    card = get_card(card_id)
     note_id = card_to_note(card_id)
     note = {
         'id': note_id,
@@ -1396,9 +3540,14 @@ def update_card(card_id, *, front=None, back=None):
         note['fields']['Front'] = front
     if back:
         note['fields']['Back'] = back
-    response = invoke('updateNoteFields', note=note)
-    if response and response['error'] is not None:
-        raise RuntimeError(response['error'])
+    journal.add(
+        'updateNoteFields', note=note,
+        # The deck, since eg the card might not be empty anymore
+        changed={'card_id': card_id, 'note_id': note_id, 'deck': card and card['deckName']},
+    )
+    journal.flush()
+    if mirror:
+        mirror.update(card_id, front=front, back=back)
 
 
 def edit_card(card_id):
@@ -1445,22 +3594,30 @@ def card_to_note(card_id):
 
 
 def delete_card(card_id):
-    get_empty.cache_clear()
+    card = get_card(card_id)
     note_id = card_to_note(card_id)
     if not note_id:
         # This happens if the card wasn't saved when first being added.
         # So, the note_id that we were given no longer exists
+        changed(card_id=card_id, deck=card and card['deckName'])
         return None
 
     # This unfortunately doesn't return any success code
-    invoke('deleteNotes', notes=[note_id])
+    # Invalidated once it's done, cf. Journal.flush()
+    journal.add(
+        'deleteNotes', notes=[note_id],
+        changed={'card_id': card_id, 'note_id': note_id, 'deck': card and card['deckName']},
+    )
+    journal.flush()
+    if mirror:
+        mirror.delete(card_id)
     return True
 
 
 def wrapper(string, indent=' ' * 4):
     '''Wrap the lines of string with a number of spaces, default 4
     '''
-    LINE_WIDTH = os.get_terminal_size().columns
+    # LINE_WIDTH = shutil.get_terminal_size().columns
     # WRAP_WIDTH = int(LINE_WIDTH * .8)
     WRAP_WIDTH = 80
 
@@ -1498,26 +3655,457 @@ def normalize_card(card):
     return normalized
 
 
-def sync():
-    invoke('sync')
-    # And in case we downloaded new empty cards:
-    get_empty.cache_clear()
-    # And in case we want to sync reviews done elsewhere:
-    get_learning.cache_clear()
-    get_reviewing.cache_clear()
-    get_deck_stats.cache_clear()
+class Lookahead:
+    """Prepares the next cards of a result set in a background thread
+
+    ie fetches, normalizes and renders (incl. highlighting) the `size` cards
+    from the current one onward (cf. seek()), eg of a review, so that moving on
+    to the next card (eg after answering one) shows it without waiting.
+
+    What's prepared is only used as long as the card itself (in the card_store)
+    is the same, cf. prepared().
+
+    Any new categories are only noted, to be notified once the card is shown,
+    rather than over whatever is being shown meanwhile, cf. new_categories()
+    """
+
+    def __init__(self, card_ids, *, deck, query='', size=5):
+        self.card_ids = list(card_ids)
+        self.deck = deck
+        self.query = query
+        self.size = size
+        self.i = 0
+        # card_id => (card, normalized, rendered, new categories)
+        self.cards = {}
+        self.wake = threading.Event()
+        self.cancelled = False
+        thread = threading.Thread(target=self.run, name='lookahead', daemon=True)
+        thread.start()
+
+    def seek(self, i):
+        self.i = i
+        self.wake.set()
+
+    def cancel(self):
+        self.cancelled = True
+        self.wake.set()
+
+    def prepared(self, card, query):
+        """Returns (normalized, rendered, new categories) of this card, if prepared already"""
+        entry = self.cards.get(card['cardId'])
+        if entry and entry[0] is card and query == self.query:
+            return entry[1:]
+
+    def prepare(self, card_id):
+        card = get_card(card_id)
+        if not card or (entry := self.cards.get(card_id)) and entry[0] is card:
+            return
+        front = card['fields']['Front']['value']
+        if re.findall(r'<|&[A-Za-z]+;', front):
+            # Left to normalize_card(), which might clean it, cf. --update
+            return
+        back = card['fields']['Back']['value']
+        categories = []
+        normalized = normalizer(back, term=front, notify=categories.extend)
+        rendered = renderer(normalized, self.query, term=front, deck=self.deck)
+        self.cards[card_id] = (card, normalized, rendered, categories)
+
+    def run(self):
+        while not self.cancelled:
+            self.wake.wait()
+            self.wake.clear()
+            window = self.card_ids[self.i:self.i + self.size]
+            for card_id in list(self.cards):
+                if card_id not in window:
+                    del self.cards[card_id]
+            for card_id in window:
+                if self.cancelled or self.wake.is_set():
+                    break
+                try:
+                    self.prepare(card_id)
+                # Incl. when assert_anki() gives up, eg while Anki restarts
+                except (Exception, SystemExit) as e:
+                    logging.warning(f'{card_id}: {e}')
+
+
+def replace_card(card_id, content, *, front, content_old, deck):
+    """Prompt to replace the back of a card with the (fetched) content
+
+    Shows the diff first, since any customizations of the card would be lost.
+    Returns True if the card was updated.
+    """
+
+    normalized = normalizer(content, term=front)
+
+    # idempotent?
+    normalized2 = normalizer(normalized, term=front)
+    if normalized != normalized2:
+        logging.warning("Normalizer not idempotent")
+
+    if content_old == normalized :
+        logging.debug("Identical to origin (normalized)")
+        return False
+
+    hr()
+    print(renderer(normalized, front, term=front, deck=deck))
+
+    # print a diff to make it easier to see if any important
+    # customizations would be lost
+    hr()
+    diff_lines = list(difflib.Differ().compare(content_old.splitlines(),normalized.splitlines()))
+    for i in range(len(diff_lines)) :
+        diff_lines[i] = re.sub(r'^(\+\s*\S+.*?)$', C.GN + r'\1' + C.DN, diff_lines[i])
+        diff_lines[i] = re.sub(r'^(\-\s*\S+.*?)$', C.RN + r'\1' + C.DN, diff_lines[i])
+        diff_lines[i] = re.sub(r'^(\?\s*\S+.*?)$', C.WB + r'\1' + C.DN, diff_lines[i])
+    print(*diff_lines, sep='\n')
+
+    prompt = (''
+        + "\nReplace "
+        + W(C.COMM, front)
+        + " with this definition? [N]/y: "
+    )
+    print(prompt, end='')
+    reply = None
+    try:
+        reply = readchar.readkey()
+    except (KeyboardInterrupt) as e:
+        ...
+    finally:
+        clear_line()
+    if reply and reply.casefold() == 'y':
+        update_card(card_id, back=normalized)
+        return True
+    return False
+
+
+def renormalize(deck, *, dry_run=False, chunk=500):
+    """Headless: normalize the 'Back' of each card of a deck, cf. normalize_card()
+
+    Only the 'Back', and without notifying any new categories (cf.
+    new_categories()), since nothing is being shown, unlike normalize_card().
+    Rather than driving main() via --update --scroll, cards are streamed in
+    chunks via cards_info(), and the changed ones are written back with one
+    `multi` of `updateNoteFields` per chunk, through the journal (so that
+    nothing is lost if Anki goes away meanwhile, cf. Journal). With dry_run,
+    just prints a diff of each change. Returns the number of cards (to be)
+    updated.
+    """
+
+    start = time.monotonic()
+    card_ids = invoke('findCards', query=f'deck:{deck}') or []
+    cards_n = updated_n = 0
+    for i in range(0, len(card_ids), chunk):
+        batch = Batch()
+        updates = []
+        for card_id, card in cards_info(card_ids[i:i+chunk]).items():
+            if not card or card['modelName'] != 'Basic':
+                continue
+            cards_n += 1
+            front = card['fields']['Front']['value']
+            back = card['fields']['Back']['value']
+            try:
+                normalized = normalizer(back, term=front, notify=None)
+            except Exception as e:
+                # eg a front that's not a valid regex, cf. term_prefix_re()
+                logging.warning(f'{front} ({card_id}): {e}')
+                continue
+            if normalized == back:
+                continue
+            if dry_run:
+                diff_lines = difflib.unified_diff(
+                    back.splitlines(), normalized.splitlines(),
+                    f'{front} ({card_id})', 'normalized', lineterm='',
+                )
+                for line in diff_lines:
+                    line = re.sub(r'^(\+(?!\+\+ ).*)$', C.GN + r'\1' + C.DN, line)
+                    line = re.sub(r'^(\-(?!-- ).*)$', C.RN + r'\1' + C.DN, line)
+                    print(line)
+                updated_n += 1
+                continue
+            batch.add('updateNoteFields', note={'id': card['note'], 'fields': {'Back': normalized}})
+            updates.append((card_id, card['note'], normalized))
+
+        if not updates:
+            continue
+        # One journal entry per chunk, ie a `multi` within the journal's `multi`
+        id = journal.add('multi', actions=batch.actions, changed={'deck': deck})
+        results = journal.flush()
+        if results is None:
+            clear_line()
+            logging.error(
+                "Anki can't be reached. The updates of this chunk are journaled, "
+                "and sent once it's back (also on the next start)"
+            )
+            break
+        responses = results.get(id) or []
+        tags = set()
+        for (card_id, note_id, normalized), response in zip(updates, responses):
+            if not isinstance(response, dict) or response.get('error') is not None:
+                logging.error(f'{card_id}: {response}')
+                continue
+            updated_n += 1
+            tags |= { f'card:{card_id}', f'note:{note_id}' }
+            if mirror:
+                mirror.update(card_id, back=normalized)
+        invalidate(*tags)
+        if not dry_run:
+            status(f'Updated: {updated_n}/{cards_n} of {len(card_ids)} ...')
+
+    clear_line()
+    if updated_n and not dry_run:
+        changed(deck=deck)
+    secs = time.monotonic() - start
+    print(''
+        + f"{cards_n} cards, "
+        + f"{updated_n} {'to update' if dry_run else 'updated'}, "
+        + f"in {secs:.1f}s "
+        + f"({cards_n / (secs or 1):.0f} cards/s)"
+    )
+    return updated_n
+
+
+def fill_empties(deck, *, workers=4):
+    """Non-interactively, re-add each empty card with its fetched definition
+
+    Like the 'm' command, but prefetched concurrently, cf. Prefill. Cards are
+    kept (still empty) if the term wasn't found, or if the deck already has
+    another card for it. Returns the number added.
+    """
+
+    empty_ids = get_empty(deck)
+    card_store.prefetch(empty_ids)
+    terms = {
+        card_id: card['fields']['Front']['value']
+        for card_id in empty_ids if (card := get_card(card_id))
+    }
+    prefill = Prefill(terms.values(), lang=deck, workers=workers)
+    start = time.monotonic()
+    try:
+        while not prefill.done():
+            status(prefill.progress())
+            time.sleep(.1)
+    except KeyboardInterrupt:
+        prefill.cancel()
+    clear_line()
+    logging.info(f'Prefetched {len(prefill.terms)} in {time.monotonic() - start:.1f}s')
+
+    added_n = 0
+    for card_id, term in terms.items():
+        obj = prefill.results.get(term)
+        definition = obj and obj.get('definition')
+        if not definition:
+            logging.info(f'Not found: {term}')
+            continue
+        # Already have this card in this deck, duplicate ?
+        if set(search_anki(term, deck=deck, inflected=False)) - {card_id}:
+            logging.info(f'Duplicate: {term}')
+            continue
+        delete_card(card_id)
+        add_card(term, normalizer(definition, term=term), deck=deck)
+        added_n += 1
+    print(f'Added: {added_n}/{len(terms)}')
+    return added_n
+
+
+def sync() -> bool:
+    """Sync with AnkiWeb. Returns False on failure
+
+    In case we downloaded new empty cards, reviews or edits done elsewhere, any
+    of which could be in any deck, whatever depends on the decks, or on cards
+    edited/reviewed lately, is invalidated. (But eg not the stemmers, nor the
+    highlighting patterns.) What changed is queried in the same round-trip.
+    """
+
+    batch = Batch()
+    sync_i  = batch.add('sync')
+    decks_i = batch.add('deckNames')
+    cards_i = batch.add('findCards', query='edited:1 OR rated:1')
+    results = batch.send()
+    if batch.errors[sync_i] is not None:
+        return False
+
+    if results[decks_i] is None or results[cards_i] is None:
+        invalidate_all()
+    else:
+        tags = { 'deck:*' }
+        for deck in results[decks_i]:
+            tags |= deck_tags(deck)
+        tags |= { f'card:{card_id}' for card_id in results[cards_i] }
+        invalidate(*tags)
+    if mirror:
+        mirror.touch()
+    return True
+
+
+class SyncState(enum.StrEnum):
+    IDLE    = 'idle'
+    RUNNING = 'running'
+    FAILED  = 'failed'
+
+
+class Syncer:
+    """Runs sync() in a background thread, at most one at a time
+
+    And counts the local edits (adds, updates, deletes, answers) not yet synced,
+    cf. edited(). Those made while a sync is running count towards the next one.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.state = SyncState.IDLE
+        self.edits_n = 0
+        # When the last sync started (or the session did), and how long it took
+        self.last_epoch = int(time.time())
+        self.duration = None
+        # Counts the syncs that finished, eg to redraw the menu after one
+        self.version = 0
+
+    def edited(self, n=1):
+        with self.lock:
+            self.edits_n += n
+
+    def start(self) -> bool:
+        """False if a sync is already running"""
+        with self.lock:
+            if self.state == SyncState.RUNNING:
+                return False
+            self.state = SyncState.RUNNING
+            self.last_epoch = int(time.time())
+            edits_n = self.edits_n
+        thread = threading.Thread(target=self.run, args=(edits_n,), name='sync', daemon=True)
+        thread.start()
+        return True
+
+    def run(self, edits_n):
+        start = time.monotonic()
+        try:
+            # So that the answers so far are synced too
+            journal.flush()
+            synced = sync()
+        # Incl. when assert_anki() gives up, else the state would stay RUNNING
+        except (Exception, SystemExit) as e:
+            logging.warning(e)
+            synced = False
+        with self.lock:
+            self.duration = time.monotonic() - start
+            if synced:
+                self.state = SyncState.IDLE
+                self.edits_n -= edits_n
+            else:
+                self.state = SyncState.FAILED
+            self.version += 1
+        logging.info(f'Sync {self.state} after {self.duration:.1f}s')
+
+    def due(self, *, thresh_edits=10, thresh_secs=60 * 60) -> bool:
+        """Whether to sync (again) now
+
+        Check for incoming changes periodically. But push outgoing changes
+        sooner, since we know if any are pending. After a failure, wait a bit.
+        cf. Auto Sync: https://ankiweb.net/shared/info/501542723
+        """
+        now = int(time.time())
+        with self.lock:
+            if self.state == SyncState.RUNNING:
+                return False
+            if self.state == SyncState.FAILED and now < self.last_epoch + thresh_secs//10:
+                return False
+            return (0
+                or  now > self.last_epoch + thresh_secs
+                or (now > self.last_epoch + thresh_secs//10 and self.edits_n)
+                or self.edits_n > thresh_edits
+            )
+
+    def status(self):
+        """For the menu"""
+        if self.state == SyncState.RUNNING:
+            return W(C.INFO, '...')
+        if self.state == SyncState.FAILED:
+            return W(C.WARN, 'failed')
+        pending = self.edits_n and W(C.WARN, f'*{self.edits_n}') or ''
+        return (self.duration is not None and W(C.VALS, f'{self.duration:.1f}s') or '') + pending
+
 
-    # These will expire in time ... can also just reload the script with key '.'
-    # get_new.cache_clear()
-    # get_mid.cache_clear()
-    # get_old.cache_clear()
+syncer = Syncer()
 
 
 def clear_line():
-    LINE_WIDTH = os.get_terminal_size().columns
+    LINE_WIDTH = shutil.get_terminal_size().columns
     print('\r' + (' ' * LINE_WIDTH) + '\r', end='', flush=True)
 
 
+def status(msg):
+    """Show a (dim) message on the current line, until it's cleared"""
+    clear_line()
+    print(W(C.INFO, msg), end='', flush=True)
+
+
+# The bytes read by readkey(), but not returned yet, ie the keys typed ahead
+typeahead = bytearray()
+
+
+def key_length(buffer) -> Optional[int]:
+    """The length of the first key in the buffer, or None if it's incomplete
+
+    ie of a (UTF-8) char, or of an escape sequence, cf. readchar.readkey()
+    """
+
+    first = buffer[0]
+    if first == 0x1b:
+        if len(buffer) < 2:
+            # Maybe a lone Esc, unless more follows
+            return None
+        if buffer[1] == ord('['):
+            # CSI: parameters, up to a final byte, eg '\x1b[A' or '\x1b[3~'
+            for i in range(2, len(buffer)):
+                if 0x40 <= buffer[i] <= 0x7e:
+                    return i + 1
+            return None
+        if buffer[1] == ord('O'):
+            return 3 if len(buffer) >= 3 else None
+        # eg Alt-x, or Esc Esc
+        return 2
+    # The number of bytes of a UTF-8 char, from its first byte
+    length = 1 if first < 0xc0 else 2 if first < 0xe0 else 3 if first < 0xf0 else 4
+    return length if len(buffer) >= length else None
+
+
+def readkey(timeout=None):
+    """Like readchar.readkey(), but returns None if no key within timeout (secs)
+
+    A lone Esc is returned as Key.ESC (readchar would wait for a second key).
+
+    Returns one key at a time, also when several were typed since the last call
+    (eg while polling), cf. typeahead
+    """
+
+    if not typeahead and (timeout is None or not sys.stdin.isatty()):
+        return readchar.readkey()
+
+    fd = sys.stdin.fileno()
+    attrs = termios.tcgetattr(fd)
+    try:
+        # Without line buffering, so that select() sees single keys.
+        # (Ctrl-C still raises KeyboardInterrupt)
+        # (And without flushing the keys typed since the last poll)
+        tty.setcbreak(fd, termios.TCSANOW)
+        if not typeahead:
+            if not select.select([fd], [], [], timeout)[0]:
+                return None
+            typeahead.extend(os.read(fd, 32))
+        # The rest of a key might still be on its way, eg of an escape sequence
+        while (length := key_length(typeahead)) is None:
+            if not select.select([fd], [], [], .05)[0]:
+                # eg a lone Esc
+                length = len(typeahead)
+                break
+            typeahead.extend(os.read(fd, 32))
+        key = bytes(typeahead[:length])
+        del typeahead[:length]
+        return key.decode(errors='replace')
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, attrs)
+
+
 def clear_screen():
     """Wipes out the terminal buffer"""
     if not options.debug:
@@ -1559,6 +4147,21 @@ def beep(n: int = 2):
         print("\a", end='', flush=True)
 
 
+def profile_startup():
+    """Print the duration of each phase of the startup, cf. STARTUP"""
+
+    global STARTUP
+    STARTUP += [ ('first paint', time.perf_counter()) ]
+    start = STARTUP[0][1]
+    print()
+    for (_, begin), (phase, end) in zip(STARTUP, STARTUP[1:]):
+        print(f'{phase:20s} {(end - begin) * 1000:7.1f}ms {(end - start) * 1000:7.1f}ms')
+    loaded = [ name for name in LAZY if lazy_loaded(name) ]
+    print('Lazy modules loaded:', ', '.join(loaded) or '-')
+    print('Lazy modules not loaded:', ', '.join(set(LAZY) - set(loaded)) or '-')
+    print('nltk loaded:', 'nltk' in sys.modules)
+
+
 def main(deck):
     global options
 
@@ -1576,6 +4179,9 @@ def main(deck):
 
     # Is the current result set a review (else it's a search result)
     reviewing = False
+    # The cards answered in this review, whose answers might not be sent yet.
+    # (So, the cards states in the menu might not reflect them yet.)
+    answered = set()
     # Show the content only after user was prompted to review
     do_reveal = False
 
@@ -1592,9 +4198,14 @@ def main(deck):
     global suggestions
     suggestions = []
 
-    # Count num of local changes (new/deleted cards) pending sync?
-    edits_n = 0
-    sync_last_epoch = int(time.time())
+    # The remote fetch in progress, if any (cf. Fetch)
+    pending = None
+    # The definitions prefetched for the empties, if any (cf. 'M')
+    prefill = None
+    # The next cards of the result set, prepared ahead, (cf. Lookahead)
+    lookahead = None
+
+    # Local changes (new/deleted cards) pending sync are counted by the syncer
 
     # The IDs of cards that only have a front, but not back (no definition)
     # This works like a queue of cards to be deleted, fetched and (re)added.
@@ -1603,6 +4214,31 @@ def main(deck):
 
     while True:
 
+        # Handle the result of a remote fetch, once done (cf. the menu below).
+        # Or already show what the fastest provider(s) found, while the others
+        # fill in later. (But replacing a card needs the final result.)
+        if pending and (pending.done() or (pending.fresh() and pending.key not in ('r', 'R'))):
+            fetch = pending
+            if fetch.done():
+                pending = None
+            obj = fetch.see()
+            fetched = obj and obj.get('definition')
+            suggestions = obj and obj.get('suggestions') or []
+            if fetch.key in ('r', 'R'):
+                if fetched and replace_card(
+                    fetch.context['card_id'], fetched,
+                    front=fetch.term,
+                    content_old=fetch.context['content_old'],
+                    deck=deck,
+                ):
+                    syncer.edited()
+            else:
+                content = fetched
+                if content:
+                    card_id = None
+                    card_ids = []
+            # If any, suggestions/content printed below.
+
         clear_screen()
         key = None
 
@@ -1612,11 +4248,23 @@ def main(deck):
         normalized = ''
         card_id = None
         if card_ids:
+            # Load the cards of the result set in chunks, ahead of N/P paging
+            if card_ids != card_store.expected:
+                card_store.expect(card_ids)
+            if not lookahead or card_ids != lookahead.card_ids or term != lookahead.query:
+                if lookahead:
+                    lookahead.cancel()
+                lookahead = Lookahead(card_ids, deck=deck, query=term)
+            lookahead.seek(card_ids_i)
             # Set card_id and content based on card_ids and card_ids_i
             card = get_card(card_ids[card_ids_i])
+            prepared = card and lookahead.prepared(card, term)
             if card:
                 card_id = card_ids[card_ids_i]
-                normalized = normalize_card(card)
+                if prepared:
+                    # As normalize_card() would have
+                    notify_categories(prepared[2])
+                normalized = prepared and prepared[0] or normalize_card(card)
                 if normalized != card['fields']['Back']['value']:
                     updatable = True
         else:
@@ -1624,13 +4272,24 @@ def main(deck):
             if content:
                 normalized = normalizer(content, term=term)
 
+        # The counts and card states shown in the menu, as last refreshed in
+        # the background (cf. Refresher). Stale, eg right after a change.
+        state = index = None
+        stale = False
+        if deck:
+            state, stale = refresher.get(get_menu_state, deck)
+            index = state['index']
+
         logging.debug(f'{term=}')
         # Save the content, before further display-only modifications
         content = normalized
         if normalized:
             front = (card_ids and card['fields']['Front']['value']) or term or ''
             logging.debug(f'{front=}')
-            normalized = renderer(normalized, term, term=front, deck=deck)
+            if card_ids and prepared:
+                normalized = prepared[1]
+            else:
+                normalized = renderer(normalized, term, term=front, deck=deck)
 
             # If this card is due, prompt to review, don't reveal the content
             # until keypress. Ignore new/unseen cards here, because new cards
@@ -1645,7 +4304,9 @@ def main(deck):
         # no need to print every definition along the way
         if not options.scroll :
             # Hide content of to-be-reviewed card back until next iteration/keypress
-            if card_id and (not do_reveal) and (is_due(card_id) or (reviewing and is_new(card_id))):
+            if (card_id and (not do_reveal) and card_id not in answered
+                and (index.is_due(card_id) or (reviewing and index.is_new(card_id)))
+            ):
                 normalized = renderer('Press [Space] to review ...', term, term=front, deck=deck)
 
                 # Push reviewed term onto readline history,
@@ -1712,20 +4373,15 @@ def main(deck):
         menu += [ '│' ]
         menu += [ "(D)eck:" + W(C.VALS, deck) ]
 
-        # Check for incoming changes periodically.
-        # But push outgoing changes sooner, since we know if any are pending.
-        # cf. Auto Sync: https://ankiweb.net/shared/info/501542723
+        # Sync in the background, when due, cf. Syncer.due()
         # TODO make a CLI arg to enable/disable auto-sync
         sync_thresh_edits = 10 if not options.scroll else float('inf')
-        sync_thresh_secs = 60 * 60
-        if (0
-            or  int(time.time()) > sync_last_epoch + sync_thresh_secs
-            or (int(time.time()) > sync_last_epoch + sync_thresh_secs//10 and edits_n)
-            or edits_n > sync_thresh_edits
-        ):
-            sync()
-            sync_last_epoch = int(time.time())
-            edits_n = 0
+        if syncer.due(thresh_edits=sync_thresh_edits):
+            syncer.start()
+        sync_version = syncer.version
+        journal_version = journal.version
+        sync_status = syncer.status()
+        menu += [ "S(y)nc" + (sync_status and ':' + sync_status) ]
 
         # if edits_n > sync_thresh_edits :
         #     menu += [ COLOR_WARN + "*" + COLOR_RESET ]
@@ -1741,15 +4397,17 @@ def main(deck):
         # if n_new := deck and len(get_new(deck, ts=time.time()//3600)) :
         #     menu += [ "new:" + COLOR_VALUE + str(n_new) + RESET ]
 
-        stats = get_deck_stats(ts=time.time()//60)
         if deck:
-            new_n = stats[deck]['new']
-            lrn_n = stats[deck]['learn']
-            rev_n = stats[deck]['review']
+            new_n = state['stats']['new']
+            lrn_n = state['stats']['learn']
+            rev_n = state['stats']['review']
+            is_new_card    = index.is_new(card_id)
+            is_review_card = index.is_review(card_id)
+            is_learn_card  = index.is_learn(card_id)
             if reviewing or lrn_n or rev_n :
                 logging.debug(f'{new_n=}/{lrn_n=}/{rev_n=}/{card_id=}/{reviewing=}')
                 if card_id:
-                    logging.debug(f'{is_new(card_id)=}/{is_review(card_id)=}/{is_learn(card_id)=}')
+                    logging.debug(f'{is_new_card=}/{is_review_card=}/{is_learn_card=}')
 
                 # Match colors used in the Anki GUI
                 # (and underline type of current card, if reviewing)
@@ -1757,27 +4415,35 @@ def main(deck):
                     + "Re(v)iew:"
                     + ' '
                     # Blue/underline for new cards
-                    + (C.BU if reviewing and card_id and is_new(card_id)
+                    + (C.BU if reviewing and card_id and is_new_card
                         else C.BN if new_n > 0 else C.DD)
                     + f'{new_n:4d}'
                     + C.DN + ' '
                     # Green/underline for reviewing cards
-                    + (C.GU if reviewing and card_id and is_review(card_id)
+                    + (C.GU if reviewing and card_id and is_review_card
                         else C.GN if rev_n > 0 else C.DD)
                     + f'{rev_n:2d}'
                     + C.DN + ' '
                     # Red/underline for learning cards
-                    + (C.RU if reviewing and card_id and is_learn(card_id)
+                    + (C.RU if reviewing and card_id and is_learn_card
                         else C.RN if lrn_n > 0 else C.DD)
                     + f'{lrn_n:2d}'
                     + C.DN
                 ]
 
-        if empty_ids := deck and get_empty(deck):
+        if empty_ids := deck and state['empty']:
             menu += [
                 "E(m)pties:" + W(C.WARN, str(len(empty_ids)))
             ]
 
+        if stale:
+            # The counts are being refreshed
+            menu += [ W(C.INFO, '~') ]
+
+        if journal.failing:
+            # Changes not yet sent, eg while Anki is restarting
+            menu += [ W(C.WARN, f'Unsent:{len(journal)}') ]
+
         menu += [ '│' ]
 
         if len(card_ids) > 1:
@@ -1827,9 +4493,28 @@ def main(deck):
 
         hr()
         while not key:
+            if pending and (pending.done() or (pending.fresh() and pending.key not in ('r', 'R'))):
+                break
+            if stale and not refresher.stale(get_menu_state, deck):
+                break
+            if syncer.version != sync_version or journal.version != journal_version:
+                break
             clear_line()
+            progress = (
+                (pending and pending.progress())
+                or (prefill and not prefill.done() and prefill.progress())
+            )
+            if progress:
+                # Progress on the line above the menu, in place of the hr()
+                print('\x1b[A\r' + progress + '\x1b[K\n', end='')
             print(menu + '\r', end='', flush=True)
-            key = readchar.readkey()
+            if options.profile_startup:
+                profile_startup()
+                sys.exit(0)
+            # While fetching, poll, to update the progress.
+            # Or until the stale counts have been refreshed, synced, or answered.
+            polling = progress or stale or syncer.state == SyncState.RUNNING or len(journal)
+            key = readkey(timeout=polling and .1 or None)
 
             # Don't accept space(s),
             # It might be the user not realizing the pager has ended.
@@ -1837,9 +4522,19 @@ def main(deck):
             # if re.fullmatch(r'\s*', key) :
             #     key = None
 
+        if not key:
+            # The fetch is done (or partly), so show its result.
+            # Or the refreshed counts, or the result of the sync or answers.
+            continue
+
         logging.debug(f'{key=}')
         clear_line()
 
+        # Any of these would make the result of a fetch in progress irrelevant
+        if pending and key in ('l', 'd', 'f', 'F', 'r', 'R', 'm', '/', 'v', 's', Key.CTRL_P, Key.UP):
+            logging.info(f'Dropped fetch: {pending.term}')
+            pending = None
+
         # TODO smarter way to clear relevant state vars ?
         # What's the state machine/diagram behind all these?
 
@@ -1858,6 +4553,9 @@ def main(deck):
         if key in ('x', 'q', Key.ESC_ESC) :
             clear_line()
             sys.exit(0)
+        elif key == Key.ESC and pending:
+            logging.info(f'Cancelled fetch: {pending.term}')
+            pending = None
         elif key in ('.') :
             # Reload this script (for latest changes)
             # And show the last modification time of this file
@@ -1881,6 +4579,9 @@ def main(deck):
         elif key == 'd':
             # Switch deck
             clear_screen()
+            if prefill:
+                prefill.cancel()
+                prefill = None
 
             # TODO this needs to be wrapped in a resultset that can be cleared
             # in one command
@@ -1893,6 +4594,7 @@ def main(deck):
             content = None
 
             decks = get_deck_names()
+            stats, stats_stale = refresher.get(get_deck_stats, tuple(decks))
 
             # TODO factor out the rendering of table with headings and columns
             # (auto-calculate widths)
@@ -1902,6 +4604,7 @@ def main(deck):
                   C.GN, f'{"R":>3s}',
                   C.RN, f'{"L":>3s}',
                   C.DN,
+                  W(C.INFO, ' ~') if stats_stale else '',
                   sep='',
                   end='\n',
             )
@@ -1936,7 +4639,7 @@ def main(deck):
                 )
 
             scroll_to_menu(line_pos=len(decks)+1)
-            sync()
+            syncer.start()
 
             deck_prev = options.deck
 
@@ -1986,18 +4689,31 @@ def main(deck):
 
             # scroll_screen()
         elif key in ('y', '*') :
-            sync()
-            edits_n = 0
-            sync_last_epoch = int(time.time())
+            if not syncer.start():
+                # Already syncing
+                beep()
         elif key in ('t', Key.DEL) and card_id:
             if delete_card(card_id):
-                edits_n += 1
+                syncer.edited()
                 del card_ids[card_ids_i]
                 card_ids_i = max(0, card_ids_i - 1)
                 content = None
                 # scroll_screen()
             else:
                 beep()
+        elif key == 'i':
+            # Info: request metrics and cache stats
+            clear_screen()
+            report = '\n'.join([
+                metrics.report(), '', cache_report(), '', provider_report(),
+            ])
+            if page_cache:
+                report += '\nPage cache: ' + page_cache.stats()
+            print(report)
+            scroll_to_menu(report)
+            hr()
+            status('Press any key ...')
+            readkey()
         elif key == 'b' and term:
             # Open Anki GUI Card browser/list, for the sake of editing/custom
             # searches. If there's a term, also append it, so that it'll
@@ -2020,70 +4736,21 @@ def main(deck):
         elif key in ('p', 'N') and card_ids_i > 0:
             card_ids_i -= 1
             do_reveal = False
-        elif key == 'f' and term:
-            # Fetch (remote dictionary service)
-            obj = search(term, lang=deck)
-            content = obj and obj.get('definition')
-            suggestions = obj and obj.get('suggestions') or []
-            if content:
-                card_id = None
-                card_ids = []
-            # If any, suggestions/content printed on next iteration.
+        elif key in ('f', 'F') and term:
+            # Fetch (remote dictionary service). Shift to bypass the page_cache
+            pending = Fetch(term, lang=deck, key=key, refresh=key == 'F')
 
-        elif key == 'r' and card:
+        elif key in ('r', 'R') and card:
             # Replace old content (check remote dictionary service first).
-            content_old = content
+            # Shift to bypass the page_cache.
             # Get the 'front' value of the last displayed card,
             # since this might be a multi-resultset
             front = card['fields']['Front']['value']
-            obj = search(front, lang=deck)
-            content = obj and obj.get('definition')
-            suggestions = obj and obj.get('suggestions') or []
-
-            if not content and not suggestions:
-                ...
-                # TODO warn
-
-            if card_id and content:
-                normalized = normalizer(content, term=front)
-
-                # idempotent?
-                normalized2 = normalizer(normalized, term=front)
-                if normalized != normalized2:
-                    logging.warning("Normalizer not idempotent")
-
-                if content_old == normalized :
-                    logging.debug("Identical to origin (normalized)")
-                    continue
-
-                hr()
-                print(renderer(normalized, front, term=front, deck=deck))
-
-                # print a diff to make it easier to see if any important
-                # customizations would be lost
-                hr()
-                diff_lines = list(difflib.Differ().compare(content_old.splitlines(),normalized.splitlines()))
-                for i in range(len(diff_lines)) :
-                    diff_lines[i] = re.sub(r'^(\+\s*\S+.*?)$', C.GN + r'\1' + C.DN, diff_lines[i])
-                    diff_lines[i] = re.sub(r'^(\-\s*\S+.*?)$', C.RN + r'\1' + C.DN, diff_lines[i])
-                    diff_lines[i] = re.sub(r'^(\?\s*\S+.*?)$', C.WB + r'\1' + C.DN, diff_lines[i])
-                print(*diff_lines, sep='\n')
-
-                prompt = (''
-                    + "\nReplace "
-                    + W(C.COMM, front)
-                    + " with this definition? [N]/y: "
-                )
-                print(prompt, end='')
-                try:
-                    reply = readchar.readkey()
-                except (KeyboardInterrupt) as e:
-                    ...
-                finally:
-                    clear_line()
-                if reply and reply.casefold() == 'y':
-                    update_card(card_id, back=normalized)
-                    edits_n += 1
+            # Once fetched, cf. replace_card()
+            pending = Fetch(
+                front, lang=deck, key=key, refresh=key == 'R',
+                card_id=card_id, content_old=content,
+            )
 
         elif key == 'o' and term:
             pyperclip.copy(term)
@@ -2093,17 +4760,19 @@ def main(deck):
             launch_url(url['wiktionary'])
         elif key == 'a' and term and not card_id:
             add_card(term, content, deck=deck)
-            edits_n += 1
+            syncer.edited()
 
             # And search it to verify
             card_ids = search_anki(term, deck=deck)
             card_ids_i = 0
         elif (key in ('1','2','3','4')
             and card_id
-            and (is_due(card_id) or is_new(card_id))
+            and (index.is_due(card_id) or index.is_new(card_id))
+            and card_id not in answered
         ):
             answer_card(card_id, int(key))
-            edits_n += 1
+            answered.add(card_id)
+            syncer.edited()
             # Auto-advance
             if card_ids_i < len(card_ids) - 1:
                 card_ids_i += 1
@@ -2114,12 +4783,15 @@ def main(deck):
             # This allows the content to be revealed on next round
             do_reveal = True
         elif key == 'm' and empty_ids:
-            card_id = empty_ids[0]
-            term = get_card(card_id)['fields']['Front']['value']
+            # Skipping those already deleted, since the empties might be stale
+            card = next(filter(None, map(get_card, empty_ids)), None)
+            if not card:
+                beep()
+                continue
+            card_id = card['cardId']
+            term = card['fields']['Front']['value']
             delete_card(card_id)
-            edits_n += 1
-            get_empty.cache_clear()
-            empty_ids = get_empty(deck)
+            syncer.edited()
             card_ids = []
             card_id = None
             wild_n  = None
@@ -2133,20 +4805,36 @@ def main(deck):
                 card_ids_i = 0
                 continue
 
-            # auto fetch
-            clear_line()
-            obj = search(term, lang=deck)
-            content = obj and obj.get('definition')
-            suggestions = obj and obj.get('suggestions') or []
-            # If any, suggestions/content printed on next iteration.
+            # auto fetch, unless already prefetched (cf. 'M')
+            content = None
+            suggestions = []
+            if prefill and term in prefill.results:
+                obj = prefill.results[term]
+                content = obj and obj.get('definition')
+                suggestions = obj and obj.get('suggestions') or []
+            else:
+                pending = Fetch(term, lang=deck, key=key)
+        elif key == 'M' and empty_ids:
+            # Prefetch the definitions of all the empties, in the background
+            if prefill:
+                prefill.cancel()
+            card_store.prefetch(empty_ids)
+            prefill = Prefill(
+                [ card['fields']['Front']['value']
+                    for card_id in empty_ids if (card := get_card(card_id)) ],
+                lang=deck,
+            )
 
         elif key in ('/', 'v'):
             term = ''
             content = None
+            # So that the cards due reflect all the answers so far
+            journal.flush()
+            answered = set()
             # If no cards are due, allow reviewing of new cards, if any
             card_ids = ([]
-                or get_due(deck, ts=time.time()//3600)
-                or get_new(deck, ts=time.time()//3600)
+                or get_due(deck)
+                or get_new(deck)
             )
             card_ids_i = 0
             reviewing = True
@@ -2187,15 +4875,9 @@ def main(deck):
                 card_ids = []
                 continue
 
-            card_ids = search_anki(term, deck=deck)
+            # Exact matches, and just the count of the wildcard matches (until 'w')
+            card_ids, wild_n = search_combined(term, deck=deck)
             card_ids_i = 0
-            # Check other possible query types:
-            # TODO: Do all the searches (by trying to minimise exact and wildcard into one request).
-            # eg 'wild_n' will always contain the exact match, if there is one, so it's redundant
-
-            wild_n = len(
-                set(search_anki(term, deck=deck, field=None)) - set(card_ids)
-            )
             if not card_ids: # and not wild_n:
                 # Fetch (automatically when no local matches)
                 card_id = None
@@ -2204,15 +4886,12 @@ def main(deck):
                 if '*' in term:
                     continue
 
-                obj = search(term, lang=lang)
-                content = obj and obj.get('definition')
-                suggestions = obj and obj.get('suggestions') or []
-                # If any, suggestions/content printed on next iteration.
+                pending = Fetch(term, lang=lang, key=key)
 
         elif key == 'u' and updatable:
             update_card(card_id, back=content)
             logging.info(f"\t\t\t\t\t\tUpdated {card_id}\t{front}")
-            edits_n += 1
+            syncer.edited()
 
         else:
             logging.debug(f'No matching command for {key=}')
@@ -2225,48 +4904,137 @@ def main(deck):
             # since redundant
 
 
-def completer(text: str, state: int) -> Optional[str]:
-    completions = []
-    if not text:
+def fold(term):
+    """Accent- and case-insensitive key, eg for autocompletion"""
+    return unidecode.unidecode(term).casefold()
+
+
+class PrefixIndex:
+    """A sorted array of folded terms, for prefix lookups via bisect
+
+    cf. fold()
+    """
+
+    def __init__(self, terms=()):
+        pairs = sorted(set( (fold(term), term) for term in terms ))
+        self.keys = [ key for key, _ in pairs ]
+        self.terms = [ term for _, term in pairs ]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def prefixed(self, prefix):
+        """The terms whose key starts with the (folded) prefix"""
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + chr(0x10FFFF), lo)
+        return self.terms[lo:hi]
+
+
+# Spell-check suggestions from the last remote fetch, cf. main()
+suggestions = []
+
+
+class Completer:
+    """Tab completion (for readline) of search terms
+
+    Candidates come from (in this order) the readline history, the latest
+    spell-check suggestions, and the fronts of the cards in the current deck.
+
+    Lookups are prefix searches in PrefixIndex-es, rebuilt only when their
+    source changed. Readline calls the completer for each `state` (0, 1, ...)
+    of the same text; the candidates are computed once, for state 0.
+
+    Without the mirror, the deck's fronts come from a prefix search in Anki,
+    which is cached. A longer prefix is then filtered from the cached results of
+    a shorter prefix.
+    """
+
+    def __init__(self):
+        self.history = PrefixIndex()
+        self.history_signature = None
+        # deck => (mirror version, PrefixIndex)
+        self.fronts = {}
+        self.anki = Cache('completions', ttl=10 * 60, maxsize=100)
+        self.text = None
+        self.candidates = []
+
+    def __call__(self, text: str, state: int) -> Optional[str]:
+        if not text:
+            return None
+
+        if state == 0 or text != self.text:
+            self.text = text
+            self.candidates = self.complete(text, deck=options.deck)
+
+        if state < len(self.candidates):
+            return self.candidates[state]
+
+        if state == 0:
+            # text doesn't match any possible completion
+            beep()
+
         return None
 
-    # Unidecode allows accent-insensitive autocomplete
-    ud = unidecode.unidecode
-    text = ud(text)
+    def complete(self, text, *, deck=None):
+        # Unidecode allows accent-insensitive autocomplete
+        prefix = fold(text)
 
-    # Completions via readline history
-    for i in range(1, readline.get_current_history_length() + 1):
-        i = readline.get_history_item(i)
-        if ud(i).casefold().startswith(text.casefold()):
-            completions += [ i ]
+        # Completions via readline history
+        completions = self.history_index().prefixed(prefix)
 
-    # Completions via recent spellcheck suggestions (from last online fetch)
-    completions += [
-        s for s in suggestions if ud(s).casefold().startswith(text.casefold())
-    ]
+        # Completions via recent spellcheck suggestions (from last online fetch)
+        completions += [ s for s in suggestions if fold(s).startswith(prefix) ]
 
-    # Autocomplete via prefix search in Anki (via local HTTP server)
-    global options
-    # Only if no other maches already? Or always?
-    # if options.deck and not completions:
-    if options.deck :
-        card_ids = search_anki(text + '*', deck=options.deck)
-        for card_id in card_ids:
-            term = get_card(card_id)['fields']['Front']['value']
-            if ud(term).casefold().startswith(text.casefold()):
-                completions += [ term ]
-
-    if state < len(completions):
-        return completions[state]
-
-    if state == 0:
-        # text doesn't match any possible completion
-        beep()
+        # Autocomplete via prefix search in Anki (or its local mirror)
+        # Only if no other maches already? Or always?
+        if deck:
+            completions += self.fronts_prefixed(prefix, deck=deck)
+
+        return list(dict.fromkeys(completions))
 
-    return None
+    def history_index(self):
+        n = readline.get_current_history_length()
+        # Items can also be removed from the history, cf. the deck selection
+        signature = (n, readline.get_history_item(n))
+        if signature != self.history_signature:
+            self.history = PrefixIndex(
+                readline.get_history_item(i) for i in range(1, n + 1)
+            )
+            self.history_signature = signature
+        return self.history
+
+    def fronts_prefixed(self, prefix, *, deck):
+        if mirror:
+            version, index = self.fronts.get(deck, (None, None))
+            if version != mirror.version or deck in mirror.stale:
+                fronts = mirror.fronts(deck)
+                if fronts is not None:
+                    index = PrefixIndex(fronts)
+                    self.fronts[deck] = (mirror.version, index)
+            if index is not None:
+                return index.prefixed(prefix)
+
+        # Filter the results of the longest prefix already searched
+        for i in range(len(prefix), 0, -1):
+            hit, fronts = self.anki.lookup((deck, prefix[:i]), count=i == len(prefix))
+            if hit:
+                return [ front for front in fronts if fold(front).startswith(prefix) ]
+
+        card_ids = search_anki(prefix + '*', deck=deck)
+        card_store.prefetch(card_ids)
+        fronts = PrefixIndex(
+            card['fields']['Front']['value']
+            for card_id in card_ids if (card := get_card(card_id))
+        ).prefixed(prefix)
+        self.anki.put((deck, prefix), fronts, tags=deck_tags(deck))
+        return fronts
+
+
+completer = Completer()
 
 
 if __name__ == "__main__":
+    STARTUP += [ ('definitions', time.perf_counter()) ]
     parser = argparse.ArgumentParser()
     parser.add_argument(
         '-k',
@@ -2299,6 +5067,71 @@ if __name__ == "__main__":
         help=
         "(Auto) replace the source of each viewed card with the rendered plain text, if different",
     )
+    parser.add_argument(
+        '-t',
+        "--timeout",
+        type=float,
+        default=10,
+        help=
+        "Seconds to wait on a remote dictionary service (default: %(default)s)",
+    )
+    parser.add_argument(
+        '-r',
+        "--refresh",
+        action='store_true',
+        help=
+        "Always re-fetch from remote dictionary services, rather than from the local page cache",
+    )
+    parser.add_argument(
+        '-f',
+        "--fill",
+        action='store_true',
+        help=
+        "Fetch the definitions of all empty cards (of --deck) concurrently, re-add those found, and exit",
+    )
+    parser.add_argument(
+        '-n',
+        "--renormalize",
+        action='store_true',
+        help=
+        "Normalize the definitions of all cards (of --deck) in batches, without the interactive UI, and exit",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action='store_true',
+        help=
+        "With --renormalize, just print a diff of what would be updated",
+    )
+    parser.add_argument(
+        '-P',
+        "--providers",
+        help=
+        "Comma-separated dictionary providers to look up terms in (concurrently), "
+        f"of: {','.join(PROVIDERS)} (default: per deck)",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs='?',
+        const='-',
+        metavar='FILE',
+        help=
+        "Collect the latency of each anki-connect action and fetch (shown via 'i'). "
+        "And on exit, write them to FILE: as JSON if *.json, else in the Prometheus text format",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action='store_true',
+        help=
+        "Print how long each phase of the startup took, until the menu is first shown, and exit. "
+        "(For the imports in detail: python -X importtime)",
+    )
+    parser.add_argument(
+        '-m',
+        "--mirror",
+        action='store_true',
+        help=
+        "Keep a local (SQLite) mirror of the cards, for faster searches",
+    )
     global options
     options = parser.parse_args()
 
@@ -2326,13 +5159,46 @@ if __name__ == "__main__":
                         )
     logging.info('__main__')
 
-    decks = get_deck_names()
+    if options.mirror:
+        mirror = Mirror(__file__ + '.mirror.db')
+    page_cache = PageCache(__file__ + '.pages.db')
+    atexit.register(lambda: logging.info('Page cache: ' + page_cache.stats()))
+    # Resend any changes not done in a previous session
+    journal = Journal(__file__ + '.journal')
+    journal.replay()
+
+    if options.metrics:
+        metrics.enabled = True
+        if options.metrics != '-':
+            atexit.register(metrics.write, options.metrics)
+
     if not options.deck:
         # This will force the deck selector to open at startup
         options.deck = ''
 
     logging.debug('options:\n' + pp.pformat(options))
 
+    for name in (options.providers or '').split(','):
+        if name and name not in PROVIDERS:
+            parser.error(f'Unknown provider: {name}')
+
+    if options.profile_startup and not options.deck:
+        parser.error('--profile-startup requires a --deck')
+
+    if options.fill:
+        if not options.deck:
+            parser.error('--fill requires a --deck')
+        if fill_empties(options.deck):
+            sync()
+        sys.exit(0)
+
+    if options.renormalize:
+        if not options.deck:
+            parser.error('--renormalize requires a --deck')
+        if renormalize(options.deck, dry_run=options.dry_run) and not options.dry_run:
+            sync()
+        sys.exit(0)
+
     readline.set_completer(completer)
     readline.set_completer_delims('')
     readline.parse_and_bind("tab:menu-complete")
@@ -2348,4 +5214,5 @@ if __name__ == "__main__":
         title = "debug: " + title
     sys.stdout.write('\x1b]2;' + title + '\x07')
 
+    STARTUP += [ ('setup', time.perf_counter()) ]
     main(options.deck)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Latency of Tab completion (per prefix) on a large deck
+
+Mirrors a deck of synthetic cards from a local stand-in for anki-connect, eg:
+
+    python bench/bench_completer.py --cards 20000
+"""
+
+import argparse
+import random
+import readline
+import string
+import tempfile
+
+from common import StandInAnki, load_anki_cli, summary, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--cards', type=int, default=20_000)
+    parser.add_argument('-n', type=int, default=1000, help="prefixes to complete")
+    args = parser.parse_args()
+
+    anki = load_anki_cli(deck='nl')
+    random.seed(0)
+    letters = string.ascii_lowercase + 'éëï'
+    fronts = {
+        ''.join(random.choices(letters, k=random.randint(3, 12)))
+        for _ in range(args.cards)
+    }
+    deck = {
+        card_id: {
+            'cardId': card_id,
+            'note': card_id,
+            'deckName': 'nl',
+            'modelName': 'Basic',
+            'mod': 0,
+            'fields': {'Front': {'value': front}, 'Back': {'value': '...'}},
+        } for card_id, front in enumerate(sorted(fronts), start=1)
+    }
+    actions = {
+        'findCards': lambda query: list(deck),
+        'cardsInfo': lambda cards: [ deck[i] for i in cards ],
+    }
+    for front in random.sample(sorted(fronts), 500):
+        readline.add_history(front)
+
+    with StandInAnki(actions) as server, tempfile.NamedTemporaryFile() as db:
+        anki.anki_pool = anki.ConnectionPool(port=server.port)
+        anki.mirror = anki.Mirror(db.name)
+        anki.mirror.ready('nl')
+        completer = anki.Completer()
+        # Build the indexes
+        completer('a', 0)
+
+        prefixes = [
+            front[:random.randint(1, 3)] for front in random.choices(sorted(fronts), k=args.n)
+        ]
+        prefixes = iter(prefixes)
+
+        def complete():
+            text = next(prefixes)
+            state = 0
+            # As readline does, until there are no more candidates (max 10)
+            while completer(text, state) is not None and state < 10:
+                state += 1
+
+        latencies = timeit(complete, args.n)
+
+    print(f'{len(deck)} cards')
+    print(summary('complete (all states)', latencies))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""Per-call latency of invoke(), with and without keep-alive connections
+
+Runs against a local stand-in for anki-connect, eg:
+
+    python bench/bench_invoke.py -n 2000
+"""
+
+import argparse
+import json
+from urllib import request
+
+from common import StandInAnki, load_anki_cli, summary, timeit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', type=int, default=1000, help="calls per variant")
+    args = parser.parse_args()
+
+    anki = load_anki_cli()
+    card_ids = list(range(1_000_000, 1_000_050))
+    actions = {
+        'deckNames': lambda: ['de', 'en', 'fr', 'nl'],
+        'findCards': lambda query: card_ids,
+    }
+
+    with StandInAnki(actions) as server:
+        url = f'http://localhost:{server.port}'
+        anki.anki_pool = anki.ConnectionPool(port=server.port)
+
+        def urlopen():
+            # How invoke() used to send each request: one connection per call
+            struct = {'action': 'findCards', 'params': {'query': 'deck:nl is:new'}, 'version': 6}
+            req = request.Request(url, json.dumps(struct).encode('utf-8'))
+            return json.load(request.urlopen(req))['result']
+
+        def invoke():
+            return anki.invoke('findCards', query='deck:nl is:new')
+
+        assert urlopen() == invoke() == card_ids
+
+        # Warm-up
+        timeit(urlopen, 50)
+        timeit(invoke, 50)
+
+        before = timeit(urlopen, args.n)
+        after = timeit(invoke, args.n)
+
+    print(summary('urlopen (per call)', before))
+    print(summary('invoke (keep-alive)', after))
+    speedup = sum(before) / sum(after)
+    print(f'speedup: {speedup:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""Throughput of normalizer(), as used by --update --scroll over a whole deck
+
+Runs on synthetic woorden.org-like entries, eg:
+
+    python bench/bench_normalizer.py -n 2000
+    python bench/bench_normalizer.py --save baseline.json
+    python bench/bench_normalizer.py --baseline baseline.json
+
+(eg save the timings with an older anki-cli.py checked out, to compare with.)
+"""
+
+import argparse
+import json
+import pathlib
+import random
+import statistics
+
+from common import load_anki_cli, summary, timeit
+
+PIECES = [
+    '<sup>informeel</sup>', '<sup>sterrenkunde</sup>', '<sup>2</sup>',
+    '&lt;', '&gt;', '&nbsp;', '&eacute;', '«', '»',
+    '<a href="#">', '</a>', 'ˈ', 'ˌ', 'ː', '[3]', '<span class="x">',
+    '<i>', '</i>', '<b>', '</b>', '<br>', '<hr>', '<td>', '<tr>', '<p>', '</p>',
+    'Uitspraak: ', 'Vervoeging: ', 'Synoniemen: ', '`een voorbeeld`',
+    '1) ', '; 2. ', ' a) ', '|', ' huis', ' de kat', ' loopt', ' informeel',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', type=int, default=1000, help="entries to normalize")
+    parser.add_argument('--save', metavar='FILE', help="save the mean timing (ms) as JSON")
+    parser.add_argument('--baseline', metavar='FILE', help="compare with timings saved via --save")
+    args = parser.parse_args()
+
+    anki = load_anki_cli()
+    # Unknown categories would otherwise beep and print
+    anki.beep = lambda *args, **kwargs: None
+    anki.print = lambda *args, **kwargs: None
+
+    random.seed(0)
+    entries = [
+        ''.join(random.choices(PIECES, k=random.randint(20, 120)))
+        for _ in range(args.n)
+    ]
+    it = iter(entries * 2)
+
+    timeit(lambda: anki.normalizer(next(it), term='huis'), min(args.n, 100))
+    it = iter(entries)
+    latencies = timeit(lambda: anki.normalizer(next(it), term='huis'), args.n)
+    print(summary('normalizer (per entry)', latencies))
+    print(f'throughput: {len(latencies) / sum(latencies):.0f} entries/s')
+
+    means = { 'normalizer': statistics.fmean(latencies) * 1000 }
+    if args.baseline:
+        baseline = json.loads(pathlib.Path(args.baseline).read_text())
+        for stage in means:
+            if stage in baseline:
+                print(f'{stage:12s} {baseline[stage]:7.3f}ms -> {means[stage]:7.3f}ms '
+                      f'({baseline[stage] / means[stage]:.2f}x)')
+    if args.save:
+        pathlib.Path(args.save).write_text(json.dumps(means, indent=1) + '\n')
+
+
+if __name__ == '__main__':
+    main()
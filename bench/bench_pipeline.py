@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""Golden-corpus benchmark and regression check of the text pipeline
+
+For each HTML page in bench/corpus (cf. corpus/index.json) this parses out
+the definition, as search() would, then times normalizer(), renderer() and
+highlighter() on it. (NB, the pages are hand-written, not real captures, cf.
+README.md) The outputs must be byte-identical to those saved in
+bench/golden, and the normalizer must be idempotent, since its output is
+written back to Anki. eg:
+
+    python bench/bench_pipeline.py -n 200
+    python bench/bench_pipeline.py --save baseline.json
+    python bench/bench_pipeline.py --baseline baseline.json
+
+After an intended change of output, review, then re-generate the golden files:
+
+    python bench/bench_pipeline.py --update-golden
+"""
+
+import argparse
+import difflib
+import json
+import pathlib
+import statistics
+import sys
+
+from common import load_anki_cli, summary, timeit
+
+BENCH = pathlib.Path(__file__).resolve().parent
+CORPUS = BENCH / 'corpus'
+GOLDEN = BENCH / 'golden'
+STAGES = ('normalizer', 'renderer', 'highlighter')
+
+
+def load_corpus():
+    docs = json.loads((CORPUS / 'index.json').read_text())
+    for doc in docs:
+        doc['content'] = (CORPUS / doc['file']).read_text()
+        doc['golden'] = GOLDEN / (pathlib.Path(doc['file']).stem + '.json')
+    return docs
+
+
+def parse(anki, doc):
+    """The definition/suggestions, as the search_*() function would return"""
+
+    if doc['source'] == 'woorden':
+        return { 'definition': anki.parse_woorden(doc['content'], doc['term']) }
+    return anki.parse_thefreedictionary(doc['content'], status=doc.get('status', 200))
+
+
+def outputs(anki, doc):
+    term, deck = doc['term'], doc['lang']
+    obj = parse(anki, doc)
+    definition = obj.get('definition') or ''
+    normalized = anki.normalizer(definition, term=term)
+    return {
+        'suggestions': obj.get('suggestions'),
+        'normalized': normalized,
+        'rendered': anki.renderer(normalized, term, term=term, deck=deck),
+    }
+
+
+def check(anki, doc, *, update=False):
+    """Compare with the golden outputs (or re-generate them). Returns errors"""
+
+    errors = []
+    got = outputs(anki, doc)
+
+    # Idempotent, ie normalizing a card again (eg via 'u') changes nothing
+    normalized = got['normalized']
+    if anki.normalizer(normalized, term=doc['term']) != normalized:
+        errors.append('normalizer not idempotent')
+
+    if update:
+        doc['golden'].write_text(json.dumps(got, ensure_ascii=False, indent=1) + '\n')
+        return errors
+    if not doc['golden'].exists():
+        return errors + [f'missing golden file {doc["golden"].name} (cf. --update-golden)']
+
+    expected = json.loads(doc['golden'].read_text())
+    for key in got:
+        if got[key] == expected.get(key):
+            continue
+        diff = difflib.unified_diff(
+            repr(expected.get(key)).split('\\n'),
+            repr(got[key]).split('\\n'),
+            'golden', 'got', lineterm='',
+        )
+        errors.append(f'{key} differs:\n' + '\n'.join(diff))
+    return errors
+
+
+def bench(anki, doc, n):
+    """Per-call latencies of each stage, on this document"""
+
+    term, deck = doc['term'], doc['lang']
+    definition = parse(anki, doc).get('definition') or ''
+    normalized = anki.normalizer(definition, term=term)
+    wrapped = anki.wrapper(normalized)
+    return {
+        'normalizer': timeit(lambda: anki.normalizer(definition, term=term), n),
+        'renderer': timeit(lambda: anki.renderer(normalized, term, term=term, deck=deck), n),
+        'highlighter': timeit(lambda: anki.highlighter(wrapped, term, term=term, deck=deck), n),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', type=int, default=100, help="calls per document and stage")
+    parser.add_argument('-v', '--verbose', action='store_true', help="timings per document")
+    parser.add_argument('--update-golden', action='store_true', help="re-generate the golden outputs")
+    parser.add_argument('--save', metavar='FILE', help="save the mean timings (ms) as JSON")
+    parser.add_argument('--baseline', metavar='FILE', help="compare with timings saved via --save")
+    args = parser.parse_args()
+
+    anki = load_anki_cli()
+    # Unknown categories would otherwise beep and print
+    anki.beep = lambda *args, **kwargs: None
+    anki.print = lambda *args, **kwargs: None
+
+    docs = load_corpus()
+    failed = 0
+    for doc in docs:
+        errors = check(anki, doc, update=args.update_golden)
+        for error in errors:
+            print(f'FAIL {doc["file"]}: {error}', file=sys.stderr)
+        failed += bool(errors)
+    print(f'{len(docs) - failed}/{len(docs)} documents match the golden outputs')
+
+    totals = { stage: [] for stage in STAGES }
+    means = {}
+    for doc in docs:
+        # Warm-up
+        bench(anki, doc, min(args.n, 10))
+        latencies = bench(anki, doc, args.n)
+        for stage in STAGES:
+            totals[stage] += latencies[stage]
+            means[f'{stage}/{doc["file"]}'] = statistics.fmean(latencies[stage]) * 1000
+            if args.verbose:
+                print(summary(f'{stage:11s} {doc["file"]}', latencies[stage]))
+    for stage in STAGES:
+        means[stage] = statistics.fmean(totals[stage]) * 1000
+        print(summary(f'{stage} (all)', totals[stage]))
+
+    if args.baseline:
+        baseline = json.loads(pathlib.Path(args.baseline).read_text())
+        for stage in STAGES:
+            if stage in baseline:
+                print(f'{stage:12s} {baseline[stage]:7.3f}ms -> {means[stage]:7.3f}ms '
+                      f'({baseline[stage] / means[stage]:.2f}x)')
+    if args.save:
+        pathlib.Path(args.save).write_text(json.dumps(means, indent=1) + '\n')
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Throughput of --renormalize over a whole deck (cards/s)
+
+Runs against a local stand-in for anki-connect, with a deck of synthetic,
+not yet normalized, cards, eg:
+
+    python bench/bench_renormalize.py -n 5000
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+from common import StandInAnki, load_anki_cli
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', type=int, default=2000, help="cards in the deck")
+    args = parser.parse_args()
+
+    anki = load_anki_cli(deck='nl')
+    # Unknown categories would otherwise beep and print
+    anki.beep = lambda *args, **kwargs: None
+
+    cards = {
+        card_id: {
+            'cardId': card_id,
+            'note': card_id + 1_000_000,
+            'deckName': 'nl',
+            'modelName': 'Basic',
+            'fields': {
+                'Front': {'value': f'woord{card_id}', 'order': 0},
+                'Back': {'value': (
+                    f'<b>woord{card_id}</b>&nbsp;<sup>informeel</sup><br>'
+                    f'Uitspraak: [ˈwoːrt]<br>Verbuigingen: woord|en (meerv.)<br>'
+                    f'1) betekenis; 2. voorbeeld `een zin`'
+                ), 'order': 1},
+            },
+        }
+        for card_id in range(1, args.n + 1)
+    }
+    notes = { card['note']: card for card in cards.values() }
+
+    def update_note_fields(note):
+        for name, value in note['fields'].items():
+            notes[note['id']]['fields'][name]['value'] = value
+
+    actions = {
+        'findCards': lambda query: list(cards),
+        # (The param is also called 'cards')
+        'cardsInfo': lambda **params: [ cards.get(i) for i in params['cards'] ],
+        'updateNoteFields': update_note_fields,
+    }
+
+    with StandInAnki(actions) as server:
+        anki.anki_pool = anki.ConnectionPool(port=server.port)
+        for dry_run in (True, False, True):
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                updated_n = anki.renormalize('nl', dry_run=dry_run)
+            secs = time.perf_counter() - start
+            label = 'dry-run' if dry_run else 'update'
+            print(f'{label:8s} cards={args.n} updated={updated_n:<6d} '
+                  f'{secs:6.2f}s {args.n / secs:7.0f} cards/s '
+                  f'actions={sum(server.counts.values())} multi={server.counts.get("multi", 0)}')
+            server.counts.clear()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Shared helpers for the benchmarks in this directory
+
+The CLI is a single script (with a '-' in its name), so it's loaded by path
+rather than imported. And the stand-in server answers anki-connect requests
+locally, so that benchmarks measure this script, rather than Anki itself.
+"""
+
+import argparse
+import http.server
+import importlib.util
+import json
+import pathlib
+import statistics
+import threading
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def load_anki_cli(**options):
+    """Load anki-cli.py as a module, with default CLI options"""
+
+    spec = importlib.util.spec_from_file_location('anki_cli', ROOT / 'anki-cli.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    defaults = dict(debug=False, deck='', update=False, scroll=False, timeout=10, refresh=False, providers=None,
+                    profile_startup=False)
+    module.options = argparse.Namespace(**{**defaults, **options})
+    return module
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    # Like anki-connect, allow (but don't require) keep-alive
+    protocol_version = 'HTTP/1.1'
+    # Send the headers and the body without waiting on (delayed) ACKs
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length))
+        body = json.dumps(self.server.dispatch(request)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        ...
+
+
+class StandInAnki(http.server.ThreadingHTTPServer):
+    """A minimal anki-connect, answering from a dict of action handlers
+
+    eg StandInAnki({'deckNames': lambda: ['nl', 'en']})
+    """
+
+    daemon_threads = True
+
+    def __init__(self, actions=None, host='localhost', port=0):
+        super().__init__((host, port), StandInHandler)
+        self.actions = {'version': lambda: 6, **(actions or {})}
+        self.actions.setdefault('multi', self.multi)
+        self.counts = {}
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def dispatch(self, request):
+        action = request['action']
+        self.counts[action] = self.counts.get(action, 0) + 1
+        try:
+            result = self.actions[action](**request.get('params', {}))
+        except Exception as e:
+            return {'result': None, 'error': f'{type(e).__name__}: {e}'}
+        return {'result': result, 'error': None}
+
+    def multi(self, actions):
+        return [ self.dispatch(action) for action in actions ]
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def timeit(func, n):
+    """Call func() n times, return the per-call latencies (seconds)"""
+
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def summary(name, latencies):
+    ms = [ t * 1000 for t in latencies ]
+    ms.sort()
+    p95 = ms[int(len(ms) * .95) - 1]
+    return (
+        f'{name:24s} n={len(ms):<6d} '
+        f'mean={statistics.fmean(ms):7.3f}ms '
+        f'p50={statistics.median(ms):7.3f}ms '
+        f'p95={p95:7.3f}ms'
+    )
@@ -0,0 +1,65 @@
+"""NL double-letter variants of a search query, cf. search_variants()"""
+
+import pathlib
+import sys
+
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / 'bench'))
+from common import load_anki_cli
+
+
+@pytest.fixture(scope='module')
+def anki():
+    return load_anki_cli()
+
+
+def variants(anki, query):
+    return anki.search_variants(query, deck='nl')
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('maken', {'maken'}),
+    ('maaken', {'maaken', 'maken'}),
+    ('vooraanmelden', {'vooraanmelden', 'vooranmelden', 'voraanmelden', 'voranmelden'}),
+    # Runs of 3+ letters: each length from 1 to n
+    ('aaa', {'aaa', 'aa', 'a'}),
+    ('zeeeend', {'zeeeend', 'zeeend', 'zeend', 'zend'}),
+    ('aaaaaa', {'a' * n for n in range(1, 7)}),
+])
+def test_variants(anki, query, expected):
+    found = variants(anki, query)
+    assert set(found) == expected
+    assert len(found) == len(expected)
+    # The query itself first
+    assert found[0] == query
+
+
+def test_runs_combined(anki):
+    found = variants(anki, 'aanneemmmer')
+    assert len(found) == 2 * 2 * 2 * 3
+    assert 'anemer' in found
+
+
+def test_other_decks(anki):
+    assert anki.search_variants('maaken', deck='de') == ['maaken']
+
+
+def test_capped(anki):
+    found = variants(anki, 'aabbccddeeffgghh')
+    assert len(found) == anki.VARIANTS_MAX
+    # The likeliest ones are kept: the query itself, and fully collapsed
+    assert found[:2] == ['aabbccddeeffgghh', 'abcdefgh']
+
+
+@pytest.mark.parametrize('query', ['zeeeend', 'aanneemmmer', 'aabbccddeeffgghh', 'ma*ken'])
+def test_variants_re(anki, query):
+    """The mirror matches exactly the same variants as the query sent to Anki"""
+    found = variants(anki, query)
+    matches = anki.variants_re(query, deck='nl').fullmatch
+    assert all(matches(term.casefold()) for term in found if '*' not in term)
+    # All have the same key, for the lookup in the mirror
+    assert len({ anki.squeeze(term) for term in found }) == 1
+    if '*' not in query:
+        # eg the fully collapsed spelling, with more letters added back in
+        assert not matches(anki.squeeze(query) + 'x')